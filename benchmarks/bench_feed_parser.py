@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: feedparser vs streaming parser on a large feed
+Compares time and peak memory to read the entries used by fetch_feeds
+"""
+
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+import email.utils
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from tech_watch import TechWatch
+
+
+def build_feed(entry_count):
+    """Build an RSS feed similar to Azure Updates, newest entries first"""
+    now = time.time()
+    items = []
+    for i in range(entry_count):
+        published = email.utils.formatdate(now - i * 3600)
+        description = (
+            f"&lt;p&gt;Generally available: Azure service update {i}. "
+            "This update brings new features, security improvements and regional availability. "
+            "See the documentation for migration guidance and pricing details.&lt;/p&gt;"
+        ) * 3
+        items.append(
+            f"<item><title>Azure update {i}</title>"
+            f"<link>https://azure.microsoft.com/updates/{i}/</link>"
+            f"<guid>https://azure.microsoft.com/updates/{i}/</guid>"
+            f"<description>{description}</description>"
+            f"<pubDate>{published}</pubDate></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+        '<title>Azure updates</title>' + ''.join(items) + '</channel></rss>'
+    ).encode('utf-8')
+
+
+def measure(label, func):
+    """Report a parser's elapsed time, then its peak memory in a separate traced run"""
+    start = time.perf_counter()
+    entries = func()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    # tracemalloc slows allocations down: trace a second run so timings stay accurate
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<12} {len(entries):>4} entries  {elapsed_ms:>9.1f} ms  {peak / 1024 / 1024:>7.1f} MB peak")
+
+
+def main():
+    watch = TechWatch(config={
+        'output': {'data_folder': tempfile.mkdtemp(), 'days_back': 2},
+        'features': {'fetcher': {'streaming_parser': True}}
+    })
+    cutoff = datetime.now() - timedelta(days=2)
+    
+    for entry_count in (1000, 5000):
+        content = build_feed(entry_count)
+        print(f"\nFeed with {entry_count} entries ({len(content) / 1024 / 1024:.1f} MB)")
+        measure("feedparser", lambda: watch._parse_feed_document('bench', content).entries[:20])
+        measure("streaming", lambda: watch._stream_entries(content, 20, cutoff))
+
+
+if __name__ == "__main__":
+    main()
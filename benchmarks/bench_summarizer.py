@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark: smart summary quality and speed
+Checks summaries of the fixture articles, then times batched summarization
+against the previous per-article implementation (which needs beautifulsoup4)
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from tech_watch import TechWatch
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'summarizer_articles.json')
+
+
+def legacy_clean_html(html_text):
+    """Previous HTML cleaning: BeautifulSoup document tree"""
+    from bs4 import BeautifulSoup
+    
+    if not html_text:
+        return ""
+    soup = BeautifulSoup(html_text, 'html.parser')
+    for script in soup(["script", "style"]):
+        script.decompose()
+    text = soup.get_text()
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return ' '.join(chunk for chunk in chunks if chunk)
+
+
+def legacy_summary(watch, text, max_length=300):
+    """Previous implementation: regex split, first 10 sentences, string concatenation"""
+    clean_text = legacy_clean_html(text)
+    if len(clean_text) <= max_length:
+        return clean_text
+    
+    sentences = re.split(r'[.!?]+', clean_text)
+    sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+    if not sentences:
+        return clean_text[:max_length] + "..."
+    
+    technical_keywords = ['azure', 'terraform', 'github', 'security', 'update',
+                          'release', 'new', 'feature', 'improvement', 'fix',
+                          'version', 'support', 'api', 'cloud', 'database']
+    
+    scored_sentences = []
+    for idx, sentence in enumerate(sentences[:10]):
+        score = (10 - idx) * 2
+        length = len(sentence)
+        if 50 <= length <= 150:
+            score += 5
+        elif length < 50:
+            score -= 2
+        sentence_lower = sentence.lower()
+        score += sum(1 for kw in technical_keywords if kw in sentence_lower) * 3
+        scored_sentences.append((score, sentence))
+    
+    scored_sentences.sort(reverse=True, key=lambda x: x[0])
+    
+    summary = ""
+    for score, sentence in scored_sentences:
+        if len(summary) + len(sentence) + 2 <= max_length:
+            summary += sentence + ". "
+        else:
+            break
+    
+    if not summary:
+        summary = sentences[0][:max_length] + "..."
+    
+    return summary.strip()
+
+
+def quality(label, summaries, segmented, fixtures):
+    """Count summaries keeping the key sentence and tokens split across sentences"""
+    key_hits = 0
+    broken = 0
+    tokens = 0
+    for summary, sentences, fixture in zip(summaries, segmented, fixtures):
+        key_hits += all(phrase in summary for phrase in fixture['key_phrases'])
+        for token in fixture['intact']:
+            tokens += 1
+            broken += not any(token in sentence for sentence in sentences)
+    print(f"  {label:<10} key sentence kept: {key_hits}/{len(fixtures)}   "
+          f"tokens split across sentences: {broken}/{tokens}")
+
+
+def main():
+    with open(FIXTURES, 'r', encoding='utf-8') as f:
+        fixtures = json.load(f)
+    texts = [fixture['text'] for fixture in fixtures]
+    
+    def new_watch():
+        return TechWatch(config={'output': {'data_folder': tempfile.mkdtemp()}})
+    
+    watch = new_watch()
+    
+    clean_texts = [watch._clean_html(text) for text in texts]
+    
+    print("Quality (fixtures)")
+    quality(
+        "legacy",
+        [legacy_summary(watch, text) for text in texts],
+        [re.split(r'[.!?]+', text) for text in clean_texts],
+        fixtures
+    )
+    quality(
+        "batched",
+        watch._summarize_texts(texts),
+        [watch._split_sentences(text) for text in clean_texts],
+        fixtures
+    )
+    
+    for copies in (50, 500):
+        # Distinct texts so the memo cache does not short-circuit the first pass
+        corpus = [f"{text} <p>Reference {i}-{n}.</p>" for n in range(copies) for i, text in enumerate(texts)]
+        print(f"\nSpeed ({len(corpus)} articles)")
+        
+        start = time.perf_counter()
+        for text in corpus:
+            legacy_summary(watch, text)
+        print(f"  {'legacy':<10} {(time.perf_counter() - start) * 1000:>9.1f} ms")
+        
+        batch_watch = new_watch()
+        start = time.perf_counter()
+        batch_watch._summarize_texts(corpus)
+        print(f"  {'batched':<10} {(time.perf_counter() - start) * 1000:>9.1f} ms")
+        
+        start = time.perf_counter()
+        batch_watch._summarize_texts(corpus)
+        print(f"  {'memoized':<10} {(time.perf_counter() - start) * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,29 +11,528 @@ import sys
 import re
 import smtplib
 import json
+import calendar
+import sqlite3
+import argparse
+import time
+import asyncio
+import threading
+import importlib.util
+import gzip
+import hashlib
+import zlib
+import io
+import email.utils
+import xml.etree.ElementTree as ET
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dateutil import parser as date_parser
 from pathlib import Path
+from urllib.parse import urlparse
 from jinja2 import Template
-from bs4 import BeautifulSoup
-from sklearn.feature_extraction.text import TfidfVectorizer
+from html.parser import HTMLParser
+from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-from collections import Counter
+from scipy import sparse
+import numpy as np
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
 
+# Fallback vocabulary for trend analysis when no technology_keywords are configured
+DEFAULT_TREND_KEYWORDS = [
+    'azure', 'terraform', 'github', 'kubernetes', 'docker', 'python',
+    'copilot', 'ai', 'security', 'vulnerability', 'release', 'update',
+    'deprecation', 'feature', 'api', 'cloud', 'database', 'sql',
+    'devops', 'ci/cd', 'container', 'serverless', 'function'
+]
+
+# Fallback keywords for summary sentence scoring when no technology_keywords are configured
+DEFAULT_SUMMARY_KEYWORDS = [
+    'azure', 'terraform', 'github', 'security', 'update', 'release', 'new', 'feature',
+    'improvement', 'fix', 'version', 'support', 'api', 'cloud', 'database'
+]
+
+# Sentence boundary: terminal punctuation, optional closing quote/bracket, whitespace,
+# then something that can start a sentence
+SENTENCE_BOUNDARY = re.compile(r'([.!?]+)["\')\]]*\s+(?=["\'(\[]?[A-Z0-9])')
+
+# Abbreviations that end with a period without ending the sentence
+SENTENCE_ABBREVIATIONS = {
+    'e.g.', 'i.e.', 'etc.', 'vs.', 'approx.', 'incl.', 'no.', 'fig.', 'mr.', 'ms.', 'dr.',
+    'inc.', 'ltd.', 'corp.', 'jan.', 'feb.', 'mar.', 'apr.', 'jun.', 'jul.', 'aug.',
+    'sep.', 'sept.', 'oct.', 'nov.', 'dec.'
+}
+
+# Tokens keep inner slashes, dots and dashes so terms like "ci/cd" or "k8s" stay whole
+TERM_TOKEN_PATTERN = r"(?u)\b\w(?:[\w/.+#-]*\w)?"
+
+
+# Renderers available for the computed report model: format -> method and file extension
+REPORT_RENDERERS = {
+    'html': {'method': '_render_html', 'extension': 'html'},
+    'text': {'method': '_render_text', 'extension': 'txt'},
+    'markdown': {'method': '_render_markdown', 'extension': 'md'},
+    'json': {'method': '_render_json_feed', 'extension': 'json'},
+    'chat': {'method': '_render_chat', 'extension': 'chat.txt'}
+}
+
+# Priority levels, highest first, and the default weight of their keywords
+PRIORITY_LEVELS = ['critical', 'high', 'medium', 'low']
+PRIORITY_TIER_WEIGHTS = {'critical': 100, 'high': 75, 'medium': 50, 'low': 25}
+
+# Icons per category
+CATEGORY_ICONS = {
+    'azure_security': '🔒',
+    'azure_architecture': '🏛️',
+    'azure_blog': '☁️',
+    'azure_database': '🗄️',
+    'azure_app_services': '🚀',
+    'terraform': '🏗️',
+    'hashicorp': '⚡',
+    'github_actions': '🐙'
+}
+
+REPORT_HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Tech Watch - {{ date }}</title>
+    <style>
+        * { box-sizing: border-box; }
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 40px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        .header h1 { margin: 0 0 10px 0; font-size: 2.5em; }
+        .header p { margin: 0; opacity: 0.9; font-size: 1.1em; }
+        .summary {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            margin-bottom: 30px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .summary h2 { margin-top: 0; color: #667eea; }
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin-top: 15px;
+        }
+        .stat {
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 5px;
+            border-left: 4px solid #667eea;
+        }
+        .stat-value { font-size: 2em; font-weight: bold; color: #667eea; }
+        .stat-label { color: #666; font-size: 0.9em; }
+        .category {
+            background: white;
+            margin-bottom: 30px;
+            border-radius: 8px;
+            overflow: hidden;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .category-header {
+            background: #667eea;
+            color: white;
+            padding: 20px;
+            font-size: 1.5em;
+            font-weight: bold;
+            text-transform: uppercase;
+        }
+        .category-content { padding: 20px; }
+        .article {
+            padding: 20px;
+            margin-bottom: 15px;
+            border-left: 4px solid #667eea;
+            background: #f8f9fa;
+            border-radius: 5px;
+            transition: transform 0.2s;
+        }
+        .article:hover {
+            transform: translateX(5px);
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }
+        .article-title {
+            font-size: 1.2em;
+            font-weight: bold;
+            margin-bottom: 8px;
+        }
+        .article-title a {
+            color: #333;
+            text-decoration: none;
+        }
+        .article-title a:hover {
+            color: #667eea;
+        }
+        .article-meta {
+            color: #666;
+            font-size: 0.9em;
+            margin-bottom: 10px;
+        }
+        .article-summary {
+            color: #555;
+            line-height: 1.6;
+        }
+        .feed-badge {
+            display: inline-block;
+            background: #667eea;
+            color: white;
+            padding: 3px 10px;
+            border-radius: 12px;
+            font-size: 0.85em;
+            margin-right: 10px;
+        }
+        .footer {
+            text-align: center;
+            padding: 30px;
+            color: #666;
+            font-size: 0.9em;
+        }
+        .errors {
+            background: #fff3cd;
+            border: 1px solid #ffc107;
+            border-radius: 5px;
+            padding: 15px;
+            margin-bottom: 20px;
+        }
+        .errors h3 {
+            margin-top: 0;
+            color: #856404;
+        }
+        .error-item {
+            color: #856404;
+            margin: 5px 0;
+        }
+        .priority-badge {
+            display: inline-block;
+            padding: 4px 10px;
+            border-radius: 12px;
+            font-size: 0.75em;
+            font-weight: bold;
+            margin-right: 10px;
+            text-transform: uppercase;
+        }
+        .priority-critical {
+            background: #dc3545;
+            color: white;
+        }
+        .priority-high {
+            background: #fd7e14;
+            color: white;
+        }
+        .priority-medium {
+            background: #28a745;
+            color: white;
+        }
+        .priority-low {
+            background: #6c757d;
+            color: white;
+        }
+        .updated-badge {
+            display: inline-block;
+            background: #d1ecf1;
+            color: #0c5460;
+            border: 1px solid #17a2b8;
+            padding: 2px 8px;
+            border-radius: 12px;
+            font-size: 0.75em;
+            margin-left: 10px;
+        }
+        .stale-badge {
+            display: inline-block;
+            background: #fff3cd;
+            color: #856404;
+            border: 1px solid #ffc107;
+            padding: 2px 8px;
+            border-radius: 12px;
+            font-size: 0.75em;
+            margin-left: 10px;
+        }
+        .top-articles {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        .top-articles h2 {
+            margin-top: 0;
+            font-size: 2em;
+        }
+        .top-article-item {
+            background: rgba(255,255,255,0.15);
+            padding: 15px;
+            border-radius: 8px;
+            margin-bottom: 15px;
+            border-left: 4px solid #ffd700;
+        }
+        .top-article-item:last-child {
+            margin-bottom: 0;
+        }
+        .top-article-item a {
+            color: white;
+            text-decoration: none;
+            font-size: 1.1em;
+            font-weight: bold;
+        }
+        .top-article-item a:hover {
+            text-decoration: underline;
+        }
+        .trends-section {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            margin-bottom: 30px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .trends-section h2 {
+            margin-top: 0;
+            color: #667eea;
+        }
+        .trend-item {
+            display: inline-block;
+            background: #e7f3ff;
+            color: #0066cc;
+            padding: 8px 15px;
+            margin: 5px;
+            border-radius: 20px;
+            font-weight: 500;
+        }
+        .trend-count {
+            background: #0066cc;
+            color: white;
+            padding: 2px 8px;
+            border-radius: 10px;
+            margin-left: 5px;
+            font-size: 0.9em;
+        }
+        .trend-growth {
+            margin-left: 5px;
+            font-size: 0.85em;
+        }
+        .trend-up { color: #28a745; }
+        .trend-down { color: #dc3545; }
+        .duplicates-section {
+            background: #fff9e6;
+            border: 1px solid #ffcc00;
+            padding: 15px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+        }
+        .duplicates-section h4 {
+            margin-top: 0;
+            color: #856404;
+        }
+        .ai-summary {
+            background: #e8f5e9;
+            border-left: 3px solid #4caf50;
+            padding: 10px;
+            margin-top: 10px;
+            border-radius: 4px;
+            font-style: italic;
+        }
+        .ai-summary::before {
+            content: "🤖 AI Summary: ";
+            font-weight: bold;
+            color: #4caf50;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>🔍 Tech Watch Report</h1>
+        <p style="font-size: 1.1em; margin: 10px 0;">Daily digest of the latest technology updates and releases</p>
+        <p style="opacity: 0.8;">Automated monitoring of Azure, Terraform, GitHub Actions, and related technologies • {{ date }}</p>
+    </div>
+
+    {% if errors %}
+    <div class="errors">
+        <h3>⚠️ Warnings</h3>
+        {% for error in errors %}
+        <div class="error-item">• {{ error }}</div>
+        {% endfor %}
+    </div>
+    {% endif %}
+
+    {% if top_articles %}
+    <div class="top-articles">
+        <h2>🔥 TOP {{ top_articles|length }} - Must Read Today</h2>
+        {% for article in top_articles %}
+        <div class="top-article-item">
+            <div style="margin-bottom: 5px;">
+                <span class="priority-badge priority-{{ article.priority }}">{{ article.priority }}</span>
+                <span style="opacity: 0.8; font-size: 0.9em;">{{ article.category|upper }}</span>
+            </div>
+            <a href="{{ article.link }}" target="_blank">{{ article.title }}</a>
+            <div style="margin-top: 8px; font-size: 0.95em; opacity: 0.9;">{{ article.summary[:150] }}...</div>
+        </div>
+        {% endfor %}
+    </div>
+    {% endif %}
+
+    {% if trends %}
+    <div class="trends-section">
+        <h2>📈 Trending Topics This Week</h2>
+        <div>
+            {% for trend in trends %}
+            <span class="trend-item">{{ trend.keyword }}<span class="trend-count">{{ trend.week_count }}</span>{% if trend.growth is not none %}<span class="trend-growth {{ 'trend-up' if trend.growth >= 0 else 'trend-down' }}">{{ '▲' if trend.growth >= 0 else '▼' }} {{ trend.growth|abs }}%</span>{% elif trend.new %}<span class="trend-growth trend-up">new</span>{% endif %}</span>
+            {% endfor %}
+        </div>
+    </div>
+    {% endif %}
+
+    <div class="summary">
+        <h2>📊 Daily Summary</h2>
+        <div class="stats">
+            <div class="stat">
+                <div class="stat-value">{{ total_articles }}</div>
+                <div class="stat-label">Articles Collected</div>
+            </div>
+            <div class="stat">
+                <div class="stat-value">{{ total_categories }}</div>
+                <div class="stat-label">Categories</div>
+            </div>
+            <div class="stat">
+                <div class="stat-value">{{ total_feeds }}</div>
+                <div class="stat-label">RSS Feeds Monitored</div>
+            </div>
+        </div>
+    </div>
+
+    {% for section in category_sections %}
+{{ section }}
+    {% endfor %}
+
+    <div class="footer">
+        <p>Automatically generated tech watch report</p>
+        <p>{{ generation_time }}</p>
+    </div>
+</body>
+</html>
+"""
+
+
+# Fragments of the HTML report, rendered and cached independently of the page
+CATEGORY_HTML_TEMPLATE = """    <div class="category">
+        <div class="category-header">
+            {{ icon }} {{ category }}
+        </div>
+        <div class="category-content">
+{{ articles_html }}
+        </div>
+    </div>"""
+
+ARTICLE_HTML_TEMPLATE = """            <div class="article">
+                <div class="article-title">
+                    <a href="{{ article.link }}" target="_blank">{{ article.title }}</a>
+                </div>
+                <div class="article-meta">
+                    <span class="priority-badge priority-{{ article.priority }}">{{ article.priority }}</span>
+                    <span class="feed-badge">{{ article.feed_name }}</span>
+                    📅 {{ article.published_str }}
+                    {% if article.updated %}<span class="updated-badge" title="Edited by the publisher since first seen">updated</span>{% endif %}
+                    {% if article.stale %}<span class="stale-badge" title="Feed unavailable, served from cache">cached</span>{% endif %}
+                </div>
+                <div class="article-summary">
+                    {{ article.summary }}
+                </div>
+                {% if article.ai_summary %}
+                <div class="ai-summary">
+                    {{ article.ai_summary }}
+                </div>
+                {% endif %}
+            </div>"""
+
+# Article fields rendered by ARTICLE_HTML_TEMPLATE: the only inputs of its cache key,
+# so values that change between runs without being shown (e.g. priority_score) keep hits
+ARTICLE_FRAGMENT_FIELDS = (
+    'title', 'link', 'priority', 'feed_name', 'published_str', 'updated', 'stale', 'summary', 'ai_summary'
+)
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Collect the text of an HTML fragment, skipping scripts and styles"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self.skip_depth += 1
+    
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style') and self.skip_depth:
+            self.skip_depth -= 1
+    
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+    
+    def unknown_decl(self, data):
+        if data.startswith('CDATA[') and not self.skip_depth:
+            self.parts.append(data[6:])
+
+
 class TechWatch:
-    def __init__(self, config_path="config.yaml"):
+    # Compiled Jinja templates, shared by all instances (template source -> Template)
+    _templates = {}
+    
+    def __init__(self, config_path="config.yaml", config=None):
         """Initialize the tech watch system"""
-        self.config = self._load_config(config_path)
+        self.config_path = config_path
+        self.config = config if config is not None else self._load_config(config_path)
         self.articles = []
         self.errors = []
         self.trends = []
         self.duplicate_groups = []
         self.top_articles = []
+        self.fragment_cache = None
+        self.feed_health = None
+        self.summary_cache = None
+        # Cleaned text of the HTML seen this run (raw -> text), shared by summaries, change detection and alerts
+        self.clean_texts = {}
+        self.summary_keywords = None
+        self.priority_rules = None
+        self.entry_fingerprints = None
+        # Critical alert fast path: alerts queued during fetching, sent by a coalescing timer
+        self.started_at = time.time()
+        self.sent_alerts = None
+        self.alert_queue = []
+        self.alert_timer = None
+        self.alert_lock = threading.Lock()
+        self.alert_flush_lock = threading.Lock()
+        # In profile mode, alerts go to each profile instead: (keywords, feed keywords, TechWatch)
+        self.profile_alerters = None
+        # Shared network resources of the async mode (set by run_async)
+        self.http_client = None
+        self.io_limit = None
+        self.host_limits = {}
+        # Event loop of the async mode: alerts flushed from other threads are sent on it
+        self.loop = None
         
     def _load_config(self, config_path):
         """Load configuration from YAML file"""
@@ -87,115 +586,301 @@ class TechWatch:
         """Clean HTML and extract plain text"""
         if not html_text:
             return ""
-        
-        # Use BeautifulSoup to clean HTML
-        soup = BeautifulSoup(html_text, 'html.parser')
-        
-        # Remove scripts and styles
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Get text
-        text = soup.get_text()
+        if html_text in self.clean_texts:
+            return self.clean_texts[html_text]
+        
+        if '<' in html_text or '&' in html_text:
+            # Stream the markup through the parser: no document tree is built
+            parser = _HTMLTextExtractor()
+            parser.feed(html_text)
+            parser.close()
+            text = ''.join(parser.parts)
+        else:
+            text = html_text
         
         # Clean whitespace
         lines = (line.strip() for line in text.splitlines())
         chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
         text = ' '.join(chunk for chunk in chunks if chunk)
         
+        self.clean_texts[html_text] = text
         return text
     
-    def _create_smart_summary(self, text, max_length=300):
-        """Create an intelligent summary by extracting the most relevant sentences"""
-        if not text:
-            return ""
-        
-        # Clean HTML text
-        clean_text = self._clean_html(text)
-        
-        if len(clean_text) <= max_length:
-            return clean_text
-        
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', clean_text)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
-        
-        if not sentences:
-            return clean_text[:max_length] + "..."
-        
-        # Calculate a simple score for each sentence based on:
-        # - Position (first sentences are important)
-        # - Length (neither too short nor too long)
-        # - Presence of technical keywords
-        technical_keywords = ['azure', 'terraform', 'github', 'security', 'update', 
-                            'release', 'new', 'feature', 'improvement', 'fix', 
-                            'version', 'support', 'api', 'cloud', 'database']
+    def _split_sentences(self, text):
+        """Split text into sentences without breaking versions, URLs or abbreviations"""
+        sentences = []
+        start = 0
+        # A boundary is terminal punctuation followed by whitespace and a sentence start,
+        # so "v1.2.3" or "https://aka.ms/x.y" never split
+        for match in SENTENCE_BOUNDARY.finditer(text):
+            preceding = text[start:match.start()].rsplit(None, 1)
+            last_word = preceding[-1].lower().lstrip('(["\'') if preceding else ''
+            is_initial = len(last_word) == 1 and last_word.isalpha()
+            if match.group(1) == '.' and (last_word + '.' in SENTENCE_ABBREVIATIONS or is_initial):
+                continue
+            sentences.append(text[start:match.end()].strip())
+            start = match.end()
+        sentences.append(text[start:].strip())
+        return [sentence for sentence in sentences if sentence]
+    
+    def _summary_keyword_weights(self):
+        """Compile the keyword weights used to score summary sentences (once per instance)"""
+        if self.summary_keywords is None:
+            tech_keywords = self.config.get('technology_keywords') or {}
+            weights = {kw.lower(): 1.0 for keywords in tech_keywords.values() for kw in (keywords or [])}
+            if not weights:
+                weights = {kw: 1.0 for kw in DEFAULT_SUMMARY_KEYWORDS}
+            weights.update({
+                kw.lower(): float(weight)
+                for kw, weight in (self.config['output'].get('summary_keyword_weights') or {}).items()
+            })
+            
+            pattern = None
+            if weights:
+                alternatives = sorted((re.escape(kw) for kw in weights), key=len, reverse=True)
+                pattern = re.compile(r'\b(?:' + '|'.join(alternatives) + r')\b')
+            self.summary_keywords = (weights, pattern)
+        return self.summary_keywords
+    
+    def _load_summary_cache(self):
+        """Load memoized summaries keyed by content hash"""
+        if self.summary_cache is None:
+            self.summary_cache = {}
+            cache_path = self._data_path('summary_cache.json')
+            if cache_path.exists():
+                try:
+                    with open(cache_path, 'r', encoding='utf-8') as f:
+                        self.summary_cache = json.load(f)
+                except Exception as e:
+                    print(f"  Could not load summary cache: {e}")
+        return self.summary_cache
+    
+    def _save_summary_cache(self, max_entries=5000):
+        """Persist memoized summaries, keeping the most recent entries (once per run)"""
+        cache = self.summary_cache
+        if cache is None:
+            return
+        if len(cache) > max_entries:
+            # Dicts keep insertion order: the oldest entries come first
+            cache = dict(list(cache.items())[-max_entries:])
+            self.summary_cache = cache
+        try:
+            with open(self._data_path('summary_cache.json'), 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"  Could not save summary cache: {e}")
+    
+    def _rank_sentences(self, documents):
+        """Score every sentence of every document in one batched TF-IDF/centroid pass"""
+        sentences = [sentence for document in documents for sentence in document]
+        doc_index = np.repeat(np.arange(len(documents)), [len(d) for d in documents])
+        position = np.concatenate([np.arange(len(d)) for d in documents])
+        length = np.array([len(sentence) for sentence in sentences])
+        
+        # Position (first sentences are important) and length (neither too short nor too long)
+        scores = np.maximum(10 - position, 0) * 2.0
+        scores += np.where((length >= 50) & (length <= 150), 5.0, np.where(length < 50, -2.0, 0.0))
+        
+        # Weighted technical keywords
+        weights, pattern = self._summary_keyword_weights()
+        if pattern is not None:
+            scores += 3.0 * np.array([
+                sum(weights[kw] for kw in set(pattern.findall(sentence.lower())))
+                for sentence in sentences
+            ])
+        
+        # Similarity to the document centroid: sentences carrying the article's main topic
+        try:
+            tfidf = TfidfVectorizer(stop_words='english', sublinear_tf=True).fit_transform(sentences)
+        except ValueError:
+            # Only stop words: no centroid signal
+            return scores
+        
+        indicator = sparse.csr_matrix(
+            (np.ones(len(sentences)), (doc_index, np.arange(len(sentences)))),
+            shape=(len(documents), len(sentences))
+        )
+        centroids = sparse.diags(1.0 / np.maximum(indicator.sum(axis=1).A1, 1)) @ indicator @ tfidf
+        norms = np.sqrt(centroids.multiply(centroids).sum(axis=1)).A1
+        similarity = np.asarray(tfidf.multiply(centroids[doc_index]).sum(axis=1)).ravel()
+        scores += 10.0 * similarity / np.maximum(norms[doc_index], 1e-9)
         
-        scored_sentences = []
-        for idx, sentence in enumerate(sentences[:10]):  # Limit to first 10
-            score = 0
+        return scores
+    
+    def _summarize_texts(self, texts, max_length=300):
+        """Create intelligent summaries for a batch of texts, memoized by content hash"""
+        cache = self._load_summary_cache()
+        weights, _ = self._summary_keyword_weights()
+        settings = json.dumps([max_length, sorted(weights.items())])
+        
+        summaries = [''] * len(texts)
+        pending = {}
+        for i, text in enumerate(texts):
+            if not text:
+                continue
             
-            # Score based on position (first sentences are important)
-            score += (10 - idx) * 2
+            # Keyed on the raw text so cache hits skip HTML cleaning as well
+            key = hashlib.sha1(f"{settings}\n{text}".encode('utf-8')).hexdigest()
+            if key in cache:
+                # Refresh the entry so pruning keeps recently used summaries
+                summaries[i] = cache[key] = cache.pop(key)
+                continue
             
-            # Score based on optimal length (50-150 characters)
-            length = len(sentence)
-            if 50 <= length <= 150:
-                score += 5
-            elif length < 50:
-                score -= 2
+            clean_text = self._clean_html(text)
+            if len(clean_text) <= max_length:
+                summaries[i] = cache[key] = clean_text
+                continue
             
-            # Score based on technical keywords
-            sentence_lower = sentence.lower()
-            keyword_count = sum(1 for kw in technical_keywords if kw in sentence_lower)
-            score += keyword_count * 3
+            sentences = [s for s in self._split_sentences(clean_text) if len(s) > 20]
+            if not sentences:
+                summaries[i] = cache[key] = clean_text[:max_length] + "..."
+                continue
+            if len(sentences) == 1:
+                # Nothing to rank: the single sentence is kept whatever its score
+                summary = sentences[0] if len(sentences[0]) + 1 <= max_length else sentences[0][:max_length] + "..."
+                summaries[i] = cache[key] = summary
+                continue
             
-            scored_sentences.append((score, sentence))
+            pending.setdefault(key, (sentences, []))[1].append(i)
         
-        # Sort by score and take best sentences
-        scored_sentences.sort(reverse=True, key=lambda x: x[0])
-        
-        # Build summary
-        summary = ""
-        for score, sentence in scored_sentences:
-            if len(summary) + len(sentence) + 2 <= max_length:
-                summary += sentence + ". "
-            else:
-                break
-        
-        if not summary:
-            summary = sentences[0][:max_length] + "..."
+        if pending:
+            documents = [sentences for sentences, _ in pending.values()]
+            scores = self._rank_sentences(documents)
+            
+            offset = 0
+            for key, (sentences, indexes) in pending.items():
+                doc_scores = scores[offset:offset + len(sentences)]
+                offset += len(sentences)
+                
+                # Take the best sentences that fit, then restore their reading order
+                chosen = []
+                total = 0
+                for idx in np.argsort(-doc_scores, kind='stable'):
+                    if total + len(sentences[idx]) + 1 > max_length:
+                        break
+                    chosen.append(idx)
+                    total += len(sentences[idx]) + 1
+                
+                if chosen:
+                    summary = ' '.join(sentences[idx] for idx in sorted(chosen))
+                else:
+                    summary = sentences[0][:max_length] + "..."
+                
+                cache[key] = summary
+                for i in indexes:
+                    summaries[i] = summary
         
-        return summary.strip()
+        # Persisted by the caller once per run (see _process_articles)
+        return summaries
     
-    def _calculate_priority(self, article):
-        """Calculate priority score for an article"""
-        features = self.config.get('features', {})
-        priority_config = features.get('priority_tagging', {})
+    def _create_smart_summary(self, text, max_length=300):
+        """Create an intelligent summary by extracting the most relevant sentences"""
+        return self._summarize_texts([text], max_length=max_length)[0]
+    
+    def _compile_priority_rules(self):
+        """Compile priority_tagging settings into keyword weights, tiers and boosts"""
+        if self.priority_rules is None:
+            priority_config = self.config.get('features', {}).get('priority_tagging', {})
+            tier_weights = {**PRIORITY_TIER_WEIGHTS, **priority_config.get('tier_weights', {})}
+            keyword_weights = {k.lower(): w for k, w in priority_config.get('keyword_weights', {}).items()}
+            boosts = priority_config.get('boosts', {})
+            recency = priority_config.get('recency', {})
+            
+            keywords, weights, ranks = [], [], []
+            rules = priority_config.get('rules', {})
+            for rank, level in enumerate(reversed(PRIORITY_LEVELS)):
+                for keyword in rules.get(level, []):
+                    keywords.append(keyword.lower())
+                    weights.append(keyword_weights.get(keyword.lower(), tier_weights[level]))
+                    ranks.append(rank)
+            
+            self.priority_rules = {
+                'keywords': keywords,
+                'weights': np.array(weights, dtype=float),
+                'ranks': np.array(ranks, dtype=int),
+                'default_weight': tier_weights['low'],
+                'match_bonus': priority_config.get('match_bonus', 0.1),
+                'feed_boosts': boosts.get('feeds', {}),
+                'category_boosts': boosts.get('categories', {}),
+                'duplicate_boost': boosts.get('duplicates', 5),
+                'half_life_hours': recency.get('half_life_hours', 72),
+                'recency_weight': recency.get('weight', 0.2)
+            }
+        return self.priority_rules
+    
+    def _score_articles(self, articles):
+        """Score a batch of articles: returns their priority levels and a NumPy array of scores
         
+        The level is the highest tier with a matching keyword (low when none match).
+        The score starts from the best matching keyword weight, adds a fraction of the other
+        matches, feed/category boosts and the duplicate group size, then decays with age.
+        """
+        priority_config = self.config.get('features', {}).get('priority_tagging', {})
         if not priority_config.get('enabled', False):
-            return 'medium', 50
-        
-        rules = priority_config.get('rules', {})
-        text = f"{article.get('title', '')} {article.get('summary', '')}".lower()
-        
-        # Check critical keywords
-        for keyword in rules.get('critical', []):
-            if keyword.lower() in text:
-                return 'critical', 100
+            return ['medium'] * len(articles), np.full(len(articles), 50.0)
+        
+        rules = self._compile_priority_rules()
+        texts = [self._priority_text(a) for a in articles]
+        
+        # One boolean column per keyword: substring matching, as the tier rules always did
+        matches = np.zeros((len(texts), len(rules['keywords'])), dtype=bool)
+        for j, keyword in enumerate(rules['keywords']):
+            matches[:, j] = np.fromiter((keyword in text for text in texts), dtype=bool, count=len(texts))
+        
+        matched = matches.any(axis=1)
+        weighted = matches * rules['weights']
+        best = np.where(matched, weighted.max(axis=1, initial=0), rules['default_weight'])
+        ranks = np.where(matched, (matches * rules['ranks']).max(axis=1, initial=0), 0)
+        
+        scores = best + rules['match_bonus'] * (weighted.sum(axis=1) - np.where(matched, best, 0))
+        scores += np.array([
+            rules['feed_boosts'].get(a.get('feed_name'), 0) + rules['category_boosts'].get(a.get('category'), 0)
+            for a in articles
+        ], dtype=float)
+        
+        # Stories covered by several sources rank higher
+        group_sizes = {}
+        for a in articles:
+            if a.get('duplicate_group'):
+                group_sizes[a['duplicate_group']] = group_sizes.get(a['duplicate_group'], 0) + 1
+        scores += rules['duplicate_boost'] * np.array(
+            [group_sizes.get(a.get('duplicate_group'), 1) - 1 for a in articles], dtype=float
+        )
         
-        # Check high priority keywords
-        for keyword in rules.get('high', []):
-            if keyword.lower() in text:
-                return 'high', 75
+        # Exponential decay of part of the score; undated articles do not decay
+        if rules['half_life_hours'] and rules['recency_weight']:
+            epochs = np.array([self._article_epoch(a) or np.nan for a in articles], dtype=float)
+            age_hours = np.clip((time.time() - epochs) / 3600, 0, None)
+            decay = np.where(np.isnan(age_hours), 1.0, 0.5 ** (age_hours / rules['half_life_hours']))
+            scores *= 1 - rules['recency_weight'] + rules['recency_weight'] * decay
         
-        # Check medium priority keywords
-        for keyword in rules.get('medium', []):
-            if keyword.lower() in text:
-                return 'medium', 50
+        levels = list(reversed(PRIORITY_LEVELS))
+        return [levels[rank] for rank in ranks], scores
+    
+    def _priority_text(self, article):
+        """Text matched against the priority rules: the title and the whole cleaned entry
         
-        # Default to low
-        return 'low', 25
+        The entry text rather than the shortened summary, so the critical alert sent while
+        fetching and the report classify an article the same way.
+        """
+        if 'raw_summary' in article:
+            body = self._clean_html(article['raw_summary'])
+        else:
+            body = article.get('summary', '')
+        return f"{article.get('title', '')} {body}".lower()
+    
+    def _rank_articles(self, articles, scores):
+        """Return article indices by score, then publication date, newest first (stable)"""
+        epochs = np.array([self._article_epoch(a) or np.nan for a in articles], dtype=float)
+        # Undated articles come last among equal scores
+        epochs = np.nan_to_num(epochs, nan=-np.inf)
+        # lexsort sorts on the last key first and keeps the input order of exact ties
+        return np.lexsort((-epochs, -np.asarray(scores)))
+    
+    def _calculate_priority(self, article):
+        """Calculate the priority level and score of a single article"""
+        levels, scores = self._score_articles([article])
+        return levels[0], round(float(scores[0]), 2)
     
     def _detect_duplicates(self):
         """Detect and group similar articles"""
@@ -232,7 +917,12 @@ class TechWatch:
                     grouped.add(j)
             
             if len(group) > 1:
+                # Group IDs derive from the lead article so they stay stable across runs
+                group_id = hashlib.sha1(self.articles[i].get('link', '').encode('utf-8')).hexdigest()[:12]
+                for idx in group:
+                    self.articles[idx]['duplicate_group'] = group_id
                 groups.append({
+                    'id': group_id,
                     'articles': [self.articles[idx] for idx in group],
                     'count': len(group)
                 })
@@ -240,43 +930,204 @@ class TechWatch:
         
         return groups
     
+    def _data_path(self, filename):
+        """Return the path of a persistent state file in the data folder"""
+        data_folder = Path(self.config['output'].get('data_folder', './data'))
+        data_folder.mkdir(parents=True, exist_ok=True)
+        return data_folder / filename
+    
+    def _trend_vocabulary(self):
+        """Build the normalized trend vocabulary from technology_keywords"""
+        tech_keywords = self.config.get('technology_keywords') or {}
+        terms = [kw for keywords in tech_keywords.values() for kw in (keywords or [])]
+        if not terms:
+            terms = DEFAULT_TREND_KEYWORDS
+        
+        # Normalize terms with the same tokenizer used on articles so multi-word
+        # keywords ("container apps") match the vectorizer's n-grams
+        vocabulary = []
+        for term in terms:
+            normalized = ' '.join(re.findall(TERM_TOKEN_PATTERN, str(term).lower()))
+            if normalized and normalized not in vocabulary:
+                vocabulary.append(normalized)
+        
+        return vocabulary
+    
+    def _build_term_matrix(self, vocabulary):
+        """Count vocabulary terms per article as a sparse article x term matrix"""
+        max_ngram = max(len(term.split()) for term in vocabulary)
+        vectorizer = CountVectorizer(
+            vocabulary=vocabulary,
+            token_pattern=TERM_TOKEN_PATTERN,
+            ngram_range=(1, max_ngram),
+            lowercase=True
+        )
+        texts = [f"{a['title']} {a['summary']}" for a in self.articles]
+        return vectorizer.transform(texts)
+    
+    def _article_day(self, article):
+        """Return the publication day of an article as a date ordinal"""
+        published = article.get('published')
+        try:
+            if isinstance(published, str):
+                return date_parser.parse(published).date().toordinal()
+            if published:
+                return datetime(*published[:6]).date().toordinal()
+        except Exception:
+            pass
+        return datetime.now().date().toordinal()
+    
+    def _load_trend_history(self, vocabulary):
+        """Load the daily term count history aligned on the given vocabulary
+        
+        Returns (days, counts, seen, seen_days): the keys and days of the articles already
+        counted, None for a history written before they were recorded.
+        """
+        history_path = self._data_path('trends_history.npz')
+        days = np.zeros(0, dtype=np.int64)
+        counts = np.zeros((0, len(vocabulary)), dtype=np.int32)
+        seen = np.zeros(0, dtype=np.uint64)
+        seen_days = np.zeros(0, dtype=np.int64)
+        
+        if history_path.exists():
+            try:
+                with np.load(history_path, allow_pickle=False) as data:
+                    stored_terms = [str(t) for t in data['terms']]
+                    stored_counts = data['counts']
+                    days = data['days'].astype(np.int64)
+                    if 'seen' in data.files:
+                        seen, seen_days = data['seen'], data['seen_days'].astype(np.int64)
+                    else:
+                        seen = seen_days = None
+                
+                # Realign columns when the vocabulary changed between runs
+                counts = np.zeros((len(days), len(vocabulary)), dtype=np.int32)
+                index = {term: i for i, term in enumerate(stored_terms)}
+                for col, term in enumerate(vocabulary):
+                    if term in index:
+                        counts[:, col] = stored_counts[:, index[term]]
+            except Exception as e:
+                print(f"  Could not load trend history: {e}")
+                days = np.zeros(0, dtype=np.int64)
+                counts = np.zeros((0, len(vocabulary)), dtype=np.int32)
+                seen = np.zeros(0, dtype=np.uint64)
+                seen_days = np.zeros(0, dtype=np.int64)
+        
+        return days, counts, seen, seen_days
+    
+    @staticmethod
+    def _trend_article_key(article):
+        """64-bit key identifying an article in the trend history"""
+        identifier = article.get('guid') or article.get('link', '')
+        return int.from_bytes(hashlib.blake2b(identifier.encode('utf-8'), digest_size=8).digest(), 'little')
+    
+    def _update_trend_history(self, vocabulary, term_matrix, history_days):
+        """Add the term counts of articles not counted yet to the on-disk daily time series"""
+        days, counts, seen, seen_days = self._load_trend_history(vocabulary)
+        
+        # Runs overlap (days_back) and each only sees part of its oldest day or of busy
+        # feeds (max_entries_per_feed): count every article once, on its first sighting
+        keys = np.array([self._trend_article_key(a) for a in self.articles], dtype=np.uint64)
+        keys, first = np.unique(keys, return_index=True)
+        is_new = ~np.isin(keys, seen) if seen is not None else np.ones(len(keys), dtype=bool)
+        new, new_keys = first[is_new], keys[is_new]
+        
+        # Aggregate article rows into day rows with one sparse product:
+        # (day x article indicator) @ (article x term counts)
+        article_days = np.array([self._article_day(self.articles[i]) for i in new], dtype=np.int64)
+        run_days, day_index = np.unique(article_days, return_inverse=True)
+        indicator = sparse.csr_matrix(
+            (np.ones(len(new), dtype=np.int32), (day_index, new)),
+            shape=(len(run_days), term_matrix.shape[0])
+        )
+        run_counts = np.asarray((indicator @ term_matrix).todense(), dtype=np.int32)
+        
+        stored = np.isin(run_days, days)
+        rows = np.searchsorted(days, run_days[stored])
+        if seen is None:
+            # History from before articles were recorded: its days may already include
+            # this run's articles, so keep the larger observation rather than adding
+            counts[rows] = np.maximum(counts[rows], run_counts[stored])
+            seen = np.zeros(0, dtype=np.uint64)
+            seen_days = np.zeros(0, dtype=np.int64)
+        else:
+            counts[rows] += run_counts[stored]
+        days = np.concatenate([days, run_days[~stored]])
+        counts = np.vstack([counts, run_counts[~stored]])
+        
+        order = np.argsort(days, kind='stable')
+        days, counts = days[order], counts[order]
+        
+        cutoff = datetime.now().date().toordinal() - history_days
+        recent = days > cutoff
+        days, counts = days[recent], counts[recent]
+        
+        # Article keys are kept as long as the days they were counted on
+        seen = np.concatenate([seen, new_keys])
+        seen_days = np.concatenate([seen_days, article_days])
+        
+        np.savez_compressed(
+            self._data_path('trends_history.npz'),
+            days=days,
+            terms=np.array(vocabulary, dtype=str),
+            counts=counts,
+            seen=seen[seen_days > cutoff],
+            seen_days=seen_days[seen_days > cutoff]
+        )
+        
+        return days, counts
+    
     def _analyze_trends(self):
         """Analyze trends from collected articles"""
         features = self.config.get('features', {})
         trends_config = features.get('trends_analysis', {})
         
-        if not trends_config.get('enabled', False):
+        if not trends_config.get('enabled', False) or not self.articles:
             return []
         
         min_mentions = trends_config.get('min_mentions', 2)
+        history_days = trends_config.get('history_days', 365)
+        top_count = trends_config.get('top_count', 10)
         
-        # Extract keywords from all articles
-        all_text = ' '.join([f"{a['title']} {a['summary']}" for a in self.articles])
-        
-        # Common tech keywords to look for
-        tech_keywords = [
-            'azure', 'terraform', 'github', 'kubernetes', 'docker', 'python',
-            'copilot', 'ai', 'security', 'vulnerability', 'release', 'update',
-            'deprecation', 'feature', 'api', 'cloud', 'database', 'sql',
-            'devops', 'ci/cd', 'container', 'serverless', 'function'
-        ]
-        
-        # Count keyword occurrences
-        keyword_counts = Counter()
-        all_text_lower = all_text.lower()
-        
-        for keyword in tech_keywords:
-            count = all_text_lower.count(keyword)
-            if count >= min_mentions:
-                keyword_counts[keyword] = count
+        vocabulary = self._trend_vocabulary()
+        term_matrix = self._build_term_matrix(vocabulary)
+        run_counts = np.asarray(term_matrix.sum(axis=0)).ravel()
         
-        # Get top trends
-        top_trends = keyword_counts.most_common(10)
-        
-        return [{'keyword': k, 'count': c} for k, c in top_trends]
+        try:
+            days, counts = self._update_trend_history(vocabulary, term_matrix, history_days)
+        except Exception as e:
+            print(f"  Could not update trend history: {e}")
+            days = np.zeros(0, dtype=np.int64)
+            counts = np.zeros((0, len(vocabulary)), dtype=np.int32)
+        
+        # Week-over-week growth on the persisted daily series
+        today = datetime.now().date().toordinal()
+        this_week = counts[days > today - 7].sum(axis=0)
+        last_week = counts[(days > today - 14) & (days <= today - 7)].sum(axis=0)
+        has_history = bool(((days > today - 14) & (days <= today - 7)).any())
+        # Terms absent last week have no growth rate: they are new, and rank first among equal volumes
+        growth = np.divide(this_week - last_week, last_week, out=np.full(len(vocabulary), np.inf),
+                           where=last_week > 0)
+        
+        candidates = np.flatnonzero(run_counts >= min_mentions)
+        # Rank by weekly volume, then growth, then this run's mentions
+        order = np.lexsort((-run_counts[candidates], -growth[candidates], -this_week[candidates]))
+        
+        trends = []
+        for idx in candidates[order][:top_count]:
+            trends.append({
+                'keyword': vocabulary[idx],
+                'count': int(run_counts[idx]),
+                'week_count': int(this_week[idx]),
+                'previous_week_count': int(last_week[idx]),
+                'growth': round(float(growth[idx]) * 100) if has_history and last_week[idx] else None,
+                'new': has_history and int(last_week[idx]) == 0
+            })
+        
+        return trends
     
-    def _get_openai_summary(self, article):
-        """Get AI-powered summary using OpenAI"""
+    def _openai_request(self, article):
+        """Build the OpenAI API key and chat completion arguments for an article"""
         features = self.config.get('features', {})
         openai_config = features.get('openai', {})
         
@@ -287,46 +1138,55 @@ class TechWatch:
         if not api_key:
             return None
         
+        text = f"Title: {article['title']}\n\n{article['summary']}"
+        
+        return api_key, {
+            'model': openai_config.get('model', 'gpt-4o-mini'),
+            'messages': [
+                {
+                    "role": "system",
+                    "content": "Summarize this tech article in 2-3 clear sentences for a DevOps engineer."
+                },
+                {
+                    "role": "user",
+                    "content": text
+                }
+            ],
+            'max_tokens': openai_config.get('max_tokens', 100),
+            'temperature': 0.3
+        }
+    
+    def _get_openai_summary(self, article):
+        """Get AI-powered summary using OpenAI"""
+        request = self._openai_request(article)
+        if request is None:
+            return None
+        
+        api_key, arguments = request
         try:
             from openai import OpenAI
             client = OpenAI(api_key=api_key)
             
-            text = f"Title: {article['title']}\n\n{article['summary']}"
-            
-            response = client.chat.completions.create(
-                model=openai_config.get('model', 'gpt-4o-mini'),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Summarize this tech article in 2-3 clear sentences for a DevOps engineer."
-                    },
-                    {
-                        "role": "user",
-                        "content": text
-                    }
-                ],
-                max_tokens=openai_config.get('max_tokens', 100),
-                temperature=0.3
-            )
+            response = client.chat.completions.create(**arguments)
             
             return response.choices[0].message.content
         except Exception as e:
             print(f"  OpenAI error: {e}")
             return None
     
-    def _send_to_teams(self, content, is_critical=False):
-        """Send notification to Microsoft Teams"""
+    def _webhook_message(self, channel, content, is_critical=False):
+        """Build the webhook URL and payload of a Teams or Slack notification"""
         features = self.config.get('features', {})
-        teams_config = features.get('teams', {})
+        channel_config = features.get(channel, {})
         
-        if not teams_config.get('enabled', False):
-            return False
+        if not channel_config.get('enabled', False):
+            return None
         
-        webhook_url = teams_config.get('webhook_url', '')
+        webhook_url = channel_config.get('webhook_url', '')
         if not webhook_url:
-            return False
+            return None
         
-        try:
+        if channel == 'teams':
             message = {
                 "@type": "MessageCard",
                 "@context": "https://schema.org/extensions",
@@ -334,561 +1194,1520 @@ class TechWatch:
                 "themeColor": "FF0000" if is_critical else "0078D7",
                 "title": "🔍 Tech Watch Update",
                 "text": content
-            }
-            
-            response = requests.post(webhook_url, json=message)
-            return response.status_code == 200
-        except Exception as e:
-            print(f"  Teams error: {e}")
-            return False
-    
-    def _send_to_slack(self, content, is_critical=False):
-        """Send notification to Slack"""
-        features = self.config.get('features', {})
-        slack_config = features.get('slack', {})
-        
-        if not slack_config.get('enabled', False):
-            return False
-        
-        webhook_url = slack_config.get('webhook_url', '')
-        if not webhook_url:
-            return False
-        
-        try:
-            message = {
-                "text": f"🔍 *Tech Watch Update*\n\n{content}",
-                "color": "#ff0000" if is_critical else "#0078d7"
-            }
-            
-            response = requests.post(webhook_url, json=message)
-            return response.status_code == 200
-        except Exception as e:
-            print(f"  Slack error: {e}")
-            return False
-    
-    def fetch_feeds(self):
-        """Fetch all configured RSS feeds"""
-        days_back = self.config['output']['days_back']
-        
-        for category, feeds in self.config['rss_feeds'].items():
-            print(f"\nProcessing category: {category.upper()}")
-            
-            for feed_config in feeds:
-                feed_name = feed_config['name']
-                feed_url = feed_config['url']
-                keywords = feed_config.get('keywords', [])
-                
-                try:
-                    print(f"  {feed_name}...")
-                    feed = feedparser.parse(feed_url)
-                    
-                    if feed.bozo:
-                        print(f"  Warning for {feed_name}: {feed.bozo_exception}")
-                    
-                    count = 0
-                    for entry in feed.entries[:20]:  # Limit to 20 articles per feed
-                        published = entry.get('published_parsed') or entry.get('updated_parsed')
-                        
-                        if self._is_recent(published, days_back) and self._matches_keywords(entry, keywords):
-                            # Create smart summary if enabled
-                            raw_summary = entry.get('summary', entry.get('description', ''))
-                            
-                            # Check if smart summaries are enabled
-                            use_smart_summary = self.config['output'].get('smart_summary', True)
-                            max_length = self.config['output'].get('summary_max_length', 300)
-                            
-                            if use_smart_summary:
-                                smart_summary = self._create_smart_summary(raw_summary, max_length=max_length)
-                                final_summary = smart_summary if smart_summary else raw_summary[:max_length]
-                            else:
-                                final_summary = raw_summary[:max_length]
-                            
-                            article = {
-                                'category': category,
-                                'feed_name': feed_name,
-                                'title': entry.get('title', 'Untitled'),
-                                'link': entry.get('link', '#'),
-                                'summary': final_summary,
-                                'published': published,
-                                'published_str': self._format_date(published)
-                            }
-                            
-                            # Calculate priority
-                            priority_level, priority_score = self._calculate_priority(article)
-                            article['priority'] = priority_level
-                            article['priority_score'] = priority_score
-                            
-                            # Try OpenAI summary if enabled
-                            openai_summary = self._get_openai_summary(article)
-                            if openai_summary:
-                                article['ai_summary'] = openai_summary
-                            
-                            self.articles.append(article)
-                            count += 1
-                    
-                    print(f"  {count} article(s) found")
-                    
-                except Exception as e:
-                    error_msg = f"Error with {feed_name}: {str(e)}"
-                    print(f"  {error_msg}")
-                    self.errors.append(error_msg)
-        
-        print(f"\nTotal: {len(self.articles)} articles collected")
-        return self.articles
-    
-    def _format_date(self, date_tuple):
-        """Format a date for display"""
-        if not date_tuple:
-            return "Unknown date"
-        try:
-            if isinstance(date_tuple, str):
-                dt = date_parser.parse(date_tuple)
-            else:
-                dt = datetime(*date_tuple[:6])
-            return dt.strftime("%d/%m/%Y %H:%M")
-        except:
-            return "Unknown date"
-    
-    def generate_report(self):
-        """Generate an HTML report"""
-        # Analyze trends
-        print("\nAnalyzing trends...")
-        self.trends = self._analyze_trends()
-        
-        # Detect duplicates
-        print("Detecting duplicate articles...")
-        self.duplicate_groups = self._detect_duplicates()
-        
-        # Sort articles by priority and date
-        sorted_articles = sorted(
-            self.articles,
-            key=lambda x: (x.get('priority_score', 50), x['published'] if x['published'] else (0,)),
-            reverse=True
-        )
+            }
+        else:
+            message = {
+                "text": f"🔍 *Tech Watch Update*\n\n{content}",
+                "color": "#ff0000" if is_critical else "#0078d7"
+            }
         
-        # Get TOP articles for executive summary
-        features = self.config.get('features', {})
-        exec_config = features.get('executive_summary', {})
-        if exec_config.get('enabled', True):
-            top_count = exec_config.get('top_count', 3)
-            self.top_articles = sorted_articles[:top_count]
+        return webhook_url, message
+    
+    def _send_to_teams(self, content, is_critical=False):
+        """Send notification to Microsoft Teams"""
+        webhook = self._webhook_message('teams', content, is_critical)
+        if webhook is None:
+            return False
         
-        # Group by category
-        by_category = {}
-        for article in sorted_articles:
-            cat = article['category']
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(article)
+        try:
+            webhook_url, message = webhook
+            response = requests.post(webhook_url, json=message)
+            return response.status_code == 200
+        except Exception as e:
+            print(f"  Teams error: {e}")
+            return False
+    
+    def _send_to_slack(self, content, is_critical=False):
+        """Send notification to Slack"""
+        webhook = self._webhook_message('slack', content, is_critical)
+        if webhook is None:
+            return False
         
-        # HTML Template
-        html_template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Tech Watch - {{ date }}</title>
-    <style>
-        * { box-sizing: border-box; }
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }
-        .header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        .header h1 { margin: 0 0 10px 0; font-size: 2.5em; }
-        .header p { margin: 0; opacity: 0.9; font-size: 1.1em; }
-        .summary {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 30px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .summary h2 { margin-top: 0; color: #667eea; }
-        .stats {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-top: 15px;
-        }
-        .stat {
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 5px;
-            border-left: 4px solid #667eea;
-        }
-        .stat-value { font-size: 2em; font-weight: bold; color: #667eea; }
-        .stat-label { color: #666; font-size: 0.9em; }
-        .category {
-            background: white;
-            margin-bottom: 30px;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .category-header {
-            background: #667eea;
-            color: white;
-            padding: 20px;
-            font-size: 1.5em;
-            font-weight: bold;
-            text-transform: uppercase;
-        }
-        .category-content { padding: 20px; }
-        .article {
-            padding: 20px;
-            margin-bottom: 15px;
-            border-left: 4px solid #667eea;
-            background: #f8f9fa;
-            border-radius: 5px;
-            transition: transform 0.2s;
-        }
-        .article:hover {
-            transform: translateX(5px);
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }
-        .article-title {
-            font-size: 1.2em;
-            font-weight: bold;
-            margin-bottom: 8px;
-        }
-        .article-title a {
-            color: #333;
-            text-decoration: none;
-        }
-        .article-title a:hover {
-            color: #667eea;
-        }
-        .article-meta {
-            color: #666;
-            font-size: 0.9em;
-            margin-bottom: 10px;
-        }
-        .article-summary {
-            color: #555;
-            line-height: 1.6;
-        }
-        .feed-badge {
-            display: inline-block;
-            background: #667eea;
-            color: white;
-            padding: 3px 10px;
-            border-radius: 12px;
-            font-size: 0.85em;
-            margin-right: 10px;
-        }
-        .footer {
-            text-align: center;
-            padding: 30px;
-            color: #666;
-            font-size: 0.9em;
-        }
-        .errors {
-            background: #fff3cd;
-            border: 1px solid #ffc107;
-            border-radius: 5px;
-            padding: 15px;
-            margin-bottom: 20px;
-        }
-        .errors h3 {
-            margin-top: 0;
-            color: #856404;
-        }
-        .error-item {
-            color: #856404;
-            margin: 5px 0;
-        }
-        .priority-badge {
-            display: inline-block;
-            padding: 4px 10px;
-            border-radius: 12px;
-            font-size: 0.75em;
-            font-weight: bold;
-            margin-right: 10px;
-            text-transform: uppercase;
-        }
-        .priority-critical {
-            background: #dc3545;
-            color: white;
-        }
-        .priority-high {
-            background: #fd7e14;
-            color: white;
-        }
-        .priority-medium {
-            background: #28a745;
-            color: white;
-        }
-        .priority-low {
-            background: #6c757d;
-            color: white;
-        }
-        .top-articles {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        .top-articles h2 {
-            margin-top: 0;
-            font-size: 2em;
-        }
-        .top-article-item {
-            background: rgba(255,255,255,0.15);
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 15px;
-            border-left: 4px solid #ffd700;
-        }
-        .top-article-item:last-child {
-            margin-bottom: 0;
-        }
-        .top-article-item a {
-            color: white;
-            text-decoration: none;
-            font-size: 1.1em;
-            font-weight: bold;
-        }
-        .top-article-item a:hover {
-            text-decoration: underline;
-        }
-        .trends-section {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 30px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .trends-section h2 {
-            margin-top: 0;
-            color: #667eea;
-        }
-        .trend-item {
-            display: inline-block;
-            background: #e7f3ff;
-            color: #0066cc;
-            padding: 8px 15px;
-            margin: 5px;
-            border-radius: 20px;
-            font-weight: 500;
-        }
-        .trend-count {
-            background: #0066cc;
-            color: white;
-            padding: 2px 8px;
-            border-radius: 10px;
-            margin-left: 5px;
-            font-size: 0.9em;
+        try:
+            webhook_url, message = webhook
+            response = requests.post(webhook_url, json=message)
+            return response.status_code == 200
+        except Exception as e:
+            print(f"  Slack error: {e}")
+            return False
+    
+    def _alerts_config(self):
+        """Return the critical alert settings with their defaults"""
+        alerts = self.config.get('features', {}).get('critical_alerts', {})
+        return {
+            'enabled': alerts.get('enabled', True),
+            'coalesce_seconds': alerts.get('coalesce_seconds', 30),
+            'retention_days': alerts.get('retention_days', 30)
         }
-        .duplicates-section {
-            background: #fff9e6;
-            border: 1px solid #ffcc00;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 20px;
+    
+    def _alerts_active(self):
+        """Whether critical articles are alerted while fetching (needs a Teams or Slack webhook)"""
+        if not self._alerts_config()['enabled']:
+            return False
+        return any(self._webhook_message(channel, '') is not None for channel in ('teams', 'slack'))
+    
+    def _load_sent_alerts(self):
+        """Load the alerts sent by previous runs, keyed by entry GUID"""
+        if self.sent_alerts is None:
+            self.sent_alerts = {}
+            store_path = self._data_path('sent_alerts.json')
+            if store_path.exists():
+                try:
+                    with open(store_path, 'r', encoding='utf-8') as f:
+                        self.sent_alerts = json.load(f)
+                except Exception as e:
+                    print(f"  Could not load sent alerts: {e}")
+        return self.sent_alerts
+    
+    def _save_sent_alerts(self):
+        """Persist sent alerts, keeping them longer than articles stay in the collection window"""
+        retention_days = max(self._alerts_config()['retention_days'], self.config['output']['days_back'] + 1)
+        cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat()
+        self.sent_alerts = {guid: alert for guid, alert in self.sent_alerts.items() if alert['sent_at'] >= cutoff}
+        try:
+            with open(self._data_path('sent_alerts.json'), 'w', encoding='utf-8') as f:
+                json.dump(self.sent_alerts, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"  Could not save sent alerts: {e}")
+    
+    def _queue_alert(self, article):
+        """Queue an article for an immediate alert if it is critical and was never alerted"""
+        if self._calculate_priority(article)[0] != 'critical':
+            return
+        
+        sent = self._load_sent_alerts()
+        with self.alert_lock:
+            if article['guid'] in sent or any(queued['guid'] == article['guid'] for queued in self.alert_queue):
+                return
+            self.alert_queue.append(article)
+            
+            # The first alert of a burst starts the window: later ones join the same message
+            if self.alert_timer is None:
+                self.alert_timer = threading.Timer(self._alerts_config()['coalesce_seconds'], self._flush_alerts)
+                self.alert_timer.daemon = True
+                self.alert_timer.start()
+    
+    def _send_alert(self, message):
+        """Send an alert to Teams and Slack, returning which channels accepted it"""
+        if self.loop is not None and self.loop.is_running():
+            # Async mode: fetch_feeds and the coalescing timer run in worker threads, while the
+            # pooled client and the concurrency limit belong to the event loop
+            future = asyncio.run_coroutine_threadsafe(self._send_alert_async(message), self.loop)
+            return future.result()
+        return [self._send_to_teams(message, is_critical=True), self._send_to_slack(message, is_critical=True)]
+    
+    async def _send_alert_async(self, message):
+        """Async counterpart of _send_alert"""
+        return await asyncio.gather(
+            self._send_webhook_async('teams', message, is_critical=True),
+            self._send_webhook_async('slack', message, is_critical=True)
+        )
+    
+    def _flush_alerts(self):
+        """Send the queued critical articles as one Teams/Slack alert and record time-to-alert"""
+        with self.alert_flush_lock:
+            with self.alert_lock:
+                queued, self.alert_queue = self.alert_queue, []
+                if self.alert_timer is not None:
+                    self.alert_timer.cancel()
+                    self.alert_timer = None
+            if not queued:
+                return
+            
+            message = f"🚨 {len(queued)} CRITICAL article(s) found!\n\n"
+            for article in queued:
+                message += f"• {article['title']}\n  {article['feed_name']} - {article['link']}\n\n"
+            
+            # Both channels are tried; an alert counts as sent if one of them accepted it
+            delivered = self._send_alert(message)
+            if not any(delivered):
+                # Not recorded as sent: the next run alerts these articles again
+                print(f"  Critical alert for {len(queued)} article(s) could not be sent")
+                return
+            
+            now = time.time()
+            time_to_alert = now - self.started_at
+            sent = self._load_sent_alerts()
+            for article in queued:
+                published = self._article_epoch(article)
+                sent[article['guid']] = {
+                    'title': article['title'],
+                    'sent_at': datetime.now().isoformat(),
+                    'time_to_alert_s': round(time_to_alert, 1),
+                    'since_published_s': round(now - published) if published else None
+                }
+            self._save_sent_alerts()
+            
+            lags = [sent[article['guid']]['since_published_s'] for article in queued]
+            lags = [lag for lag in lags if lag is not None]
+            since_published = f", {min(lags) / 60:.0f} min after publication" if lags else ""
+            print(f"  🚨 Critical alert sent for {len(queued)} article(s): "
+                  f"{time_to_alert:.1f}s after the run started{since_published}")
+    
+    def _fetcher_config(self):
+        """Return the fetch layer settings with their defaults"""
+        fetcher = self.config.get('features', {}).get('fetcher', {})
+        breaker = fetcher.get('circuit_breaker', {})
+        return {
+            'connect_timeout': fetcher.get('connect_timeout', 5),
+            'read_timeout': fetcher.get('read_timeout', 20),
+            'stale_cache': fetcher.get('stale_cache', True),
+            'streaming_parser': fetcher.get('streaming_parser', False),
+            'max_entries_per_feed': fetcher.get('max_entries_per_feed', 20),
+            'max_old_entries': fetcher.get('max_old_entries', 5),
+            'failure_threshold': breaker.get('failure_threshold', 2),
+            'cooldown_minutes': breaker.get('cooldown_minutes', 30)
         }
-        .duplicates-section h4 {
-            margin-top: 0;
-            color: #856404;
+    
+    def _load_feed_health(self):
+        """Load per-feed and per-host health persisted by previous runs"""
+        if self.feed_health is None:
+            self.feed_health = {'feeds': {}, 'hosts': {}}
+            health_path = self._data_path('feed_health.json')
+            if health_path.exists():
+                try:
+                    with open(health_path, 'r', encoding='utf-8') as f:
+                        self.feed_health.update(json.load(f))
+                except Exception as e:
+                    print(f"  Could not load feed health: {e}")
+        return self.feed_health
+    
+    def _save_feed_health(self):
+        """Persist per-feed and per-host health for the next runs"""
+        if self.feed_health is None:
+            return
+        try:
+            with open(self._data_path('feed_health.json'), 'w', encoding='utf-8') as f:
+                json.dump(self.feed_health, f, indent=2)
+        except Exception as e:
+            print(f"  Could not save feed health: {e}")
+    
+    def _host_is_open(self, host):
+        """Check whether the circuit breaker of a host currently skips its feeds"""
+        host_health = self._load_feed_health()['hosts'].get(host, {})
+        # After the cooldown the breaker is half-open: the next feed is tried again
+        return host_health.get('open_until', 0) > time.time()
+    
+    def _record_fetch(self, url, host, latency_ms, error=None, host_failure=True):
+        """Update feed health and the host's circuit breaker after a fetch attempt"""
+        health = self._load_feed_health()
+        feed_health = health['feeds'].setdefault(url, {})
+        host_health = health['hosts'].setdefault(host, {'failures': 0})
+        now = time.time()
+        
+        feed_health['latency_ms'] = round(latency_ms)
+        feed_health['last_attempt'] = now
+        
+        if error is None:
+            feed_health['failure_streak'] = 0
+            feed_health['last_success'] = now
+            feed_health.pop('last_error', None)
+            host_health['failures'] = 0
+            host_health.pop('open_until', None)
+            return
+        
+        feed_health['failure_streak'] = feed_health.get('failure_streak', 0) + 1
+        feed_health['last_error'] = error
+        if not host_failure:
+            # The host answered (e.g. 404): the feed is broken, not the host
+            return
+        host_health['failures'] = host_health.get('failures', 0) + 1
+        
+        fetcher = self._fetcher_config()
+        if host_health['failures'] >= fetcher['failure_threshold']:
+            host_health['open_until'] = now + fetcher['cooldown_minutes'] * 60
+            print(f"  Circuit open for {host}: skipping its feeds for {fetcher['cooldown_minutes']} min")
+    
+    def _feed_cache_path(self, url):
+        """Return the path of the last good copy of a feed"""
+        cache_folder = self._data_path('feed_cache')
+        cache_folder.mkdir(exist_ok=True)
+        return cache_folder / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.xml"
+    
+    def _feed_request_headers(self, url):
+        """Build request headers, revalidating the cached copy when there is one"""
+        feed_health = self._load_feed_health()['feeds'].get(url, {})
+        
+        headers = {'User-Agent': 'tech-watch (+feedparser)'}
+        if self._feed_cache_path(url).exists():
+            if feed_health.get('etag'):
+                headers['If-None-Match'] = feed_health['etag']
+            if feed_health.get('last_modified'):
+                headers['If-Modified-Since'] = feed_health['last_modified']
+        return headers
+    
+    def _store_feed_response(self, url, response):
+        """Return the document of a successful response and keep it as the cached copy"""
+        cache_path = self._feed_cache_path(url)
+        if response.status_code == 304:
+            return cache_path.read_bytes()
+        
+        content = response.content
+        cache_path.write_bytes(content)
+        feed_health = self._load_feed_health()['feeds'].setdefault(url, {})
+        feed_health['etag'] = response.headers.get('ETag')
+        feed_health['last_modified'] = response.headers.get('Last-Modified')
+        feed_health['content_type'] = response.headers.get('Content-Type')
+        return content
+    
+    def _download_feed(self, url):
+        """Download a feed document with timeouts and conditional GET"""
+        fetcher = self._fetcher_config()
+        response = requests.get(
+            url,
+            headers=self._feed_request_headers(url),
+            timeout=(fetcher['connect_timeout'], fetcher['read_timeout'])
+        )
+        response.raise_for_status()
+        return self._store_feed_response(url, response)
+    
+    def _parse_feed_document(self, url, content):
+        """Parse downloaded feed bytes with the headers feedparser would have seen"""
+        feed_health = self._load_feed_health()['feeds'].get(url, {})
+        headers = {
+            'content-location': url,
+            'content-type': feed_health.get('content_type') or 'application/xml'
         }
-        .ai-summary {
-            background: #e8f5e9;
-            border-left: 3px solid #4caf50;
-            padding: 10px;
-            margin-top: 10px;
-            border-radius: 4px;
-            font-style: italic;
+        return feedparser.parse(content, response_headers=headers)
+    
+    def _fetch_feed(self, feed_name, url):
+        """Fetch a feed document, returning (content, stale) with stale=True for a cached copy"""
+        host = urlparse(url).netloc
+        if not host:
+            # Local files are read directly
+            return Path(url).read_bytes(), False
+        
+        error = None
+        if self._host_is_open(host):
+            error = f"circuit open for {host}"
+        else:
+            start = time.perf_counter()
+            try:
+                content = self._download_feed(url)
+                self._record_fetch(url, host, (time.perf_counter() - start) * 1000)
+                return content, False
+            except Exception as e:
+                error = str(e)
+                response = getattr(e, 'response', None)
+                host_failure = response is None or response.status_code >= 500
+                self._record_fetch(url, host, (time.perf_counter() - start) * 1000, error, host_failure)
+        
+        return self._stale_feed(feed_name, url, error)
+    
+    def _stale_feed(self, feed_name, url, error):
+        """Serve the last good copy of a feed that could not be fetched"""
+        cache_path = self._feed_cache_path(url)
+        if self._fetcher_config()['stale_cache'] and cache_path.exists():
+            cached_at = datetime.fromtimestamp(cache_path.stat().st_mtime).strftime("%m/%d/%Y %H:%M")
+            self.errors.append(f"{feed_name} unavailable ({error}), showing cached copy from {cached_at}")
+            return cache_path.read_bytes(), True
+        
+        raise RuntimeError(error)
+    
+    def _element_text(self, element):
+        """Return the text of an element, flattening inline XHTML content"""
+        if element is None:
+            return ''
+        return ''.join(element.itertext()).strip()
+    
+    def _parse_entry_date(self, value):
+        """Parse an RSS (RFC 822) or Atom (ISO 8601) date into a UTC struct_time"""
+        if not value:
+            return None
+        try:
+            dt = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            try:
+                dt = date_parser.parse(value)
+            except (ValueError, OverflowError):
+                return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc).timetuple()
+    
+    def _stream_entry(self, element):
+        """Convert an RSS <item> or Atom <entry> element into a feedparser-like entry"""
+        fields = {}
+        link = ''
+        for child in element:
+            # Drop namespaces: {http://www.w3.org/2005/Atom}title -> title
+            tag = child.tag.rsplit('}', 1)[-1]
+            if tag == 'link':
+                # Atom links are attributes, RSS links are text
+                if child.get('href') and child.get('rel', 'alternate') == 'alternate':
+                    link = link or child.get('href')
+                elif child.text:
+                    link = link or child.text.strip()
+            elif tag not in fields:
+                fields[tag] = child
+        
+        summary = fields.get('summary', fields.get('description', fields.get('encoded', fields.get('content'))))
+        published = fields.get('pubDate', fields.get('published', fields.get('date')))
+        updated = fields.get('updated')
+        
+        return {
+            'id': self._element_text(fields.get('guid', fields.get('id'))) or link,
+            'title': self._element_text(fields.get('title')),
+            'link': link,
+            'summary': self._element_text(summary),
+            'published_parsed': self._parse_entry_date(self._element_text(published)),
+            'updated_parsed': self._parse_entry_date(self._element_text(updated))
         }
-        .ai-summary::before {
-            content: "🤖 AI Summary: ";
-            font-weight: bold;
-            color: #4caf50;
+    
+    def _stream_entries(self, content, limit, cutoff, max_old=5):
+        """Parse RSS/Atom entries incrementally, stopping at the limit or after a run of old entries"""
+        entries = []
+        parents = []
+        # Entries read, as feedparser's entries[:limit], and consecutive entries older than the cutoff
+        read = 0
+        old = 0
+        for event, element in ET.iterparse(io.BytesIO(content), events=('start', 'end')):
+            if event == 'start':
+                parents.append(element)
+                continue
+            
+            parents.pop()
+            if element.tag.rsplit('}', 1)[-1] not in ('item', 'entry'):
+                continue
+            
+            entry = self._stream_entry(element)
+            # Drop the parsed entry from the tree: memory stays bounded by one entry
+            if parents:
+                parents[-1].remove(element)
+            
+            read += 1
+            # Pinned items and entries edited in place break the newest-first order:
+            # an old entry is skipped, only a run of them means the rest is older still
+            dates = [d for d in (entry['published_parsed'], entry['updated_parsed']) if d]
+            if dates and datetime(*max(dates)[:6]) < cutoff:
+                old += 1
+                if old >= max_old:
+                    break
+            else:
+                old = 0
+                entries.append(entry)
+            if read >= limit:
+                break
+        
+        return entries
+    
+    def _feed_entries(self, feed_name, url, content, days_back):
+        """Parse the entries of a feed document, streaming when enabled"""
+        fetcher = self._fetcher_config()
+        limit = fetcher['max_entries_per_feed']
+        
+        if fetcher['streaming_parser']:
+            try:
+                cutoff = datetime.now() - timedelta(days=days_back)
+                return self._stream_entries(content, limit, cutoff, fetcher['max_old_entries'])
+            except ET.ParseError as e:
+                # Malformed XML: feedparser's lenient parser knows how to recover
+                print(f"  Streaming parser failed for {feed_name} ({e}), using feedparser")
+        
+        feed = self._parse_feed_document(url, content)
+        if feed.bozo:
+            print(f"  Warning for {feed_name}: {feed.bozo_exception}")
+        return feed.entries[:limit]
+    
+    def _change_detection_config(self):
+        """Return the change detection settings with their defaults"""
+        change_detection = self.config.get('features', {}).get('change_detection', {})
+        return {
+            'enabled': change_detection.get('enabled', True),
+            'simhash_threshold': change_detection.get('simhash_threshold', 3),
+            'retention_days': change_detection.get('retention_days', 90)
         }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🔍 Tech Watch Report</h1>
-        <p style="font-size: 1.1em; margin: 10px 0;">Daily digest of the latest technology updates and releases</p>
-        <p style="opacity: 0.8;">Automated monitoring of Azure, Terraform, GitHub Actions, and related technologies • {{ date }}</p>
-    </div>
-
-    {% if errors %}
-    <div class="errors">
-        <h3>⚠️ Warnings</h3>
-        {% for error in errors %}
-        <div class="error-item">• {{ error }}</div>
-        {% endfor %}
-    </div>
-    {% endif %}
-
-    {% if top_articles %}
-    <div class="top-articles">
-        <h2>🔥 TOP {{ top_articles|length }} - Must Read Today</h2>
-        {% for article in top_articles %}
-        <div class="top-article-item">
-            <div style="margin-bottom: 5px;">
-                <span class="priority-badge priority-{{ article.priority }}">{{ article.priority }}</span>
-                <span style="opacity: 0.8; font-size: 0.9em;">{{ article.category|upper }}</span>
-            </div>
-            <a href="{{ article.link }}" target="_blank">{{ article.title }}</a>
-            <div style="margin-top: 8px; font-size: 0.95em; opacity: 0.9;">{{ article.summary[:150] }}...</div>
-        </div>
-        {% endfor %}
-    </div>
-    {% endif %}
-
-    {% if trends %}
-    <div class="trends-section">
-        <h2>📈 Trending Topics This Week</h2>
-        <div>
-            {% for trend in trends %}
-            <span class="trend-item">{{ trend.keyword }}<span class="trend-count">{{ trend.count }}</span></span>
-            {% endfor %}
-        </div>
-    </div>
-    {% endif %}
-
-    <div class="summary">
-        <h2>📊 Daily Summary</h2>
-        <div class="stats">
-            <div class="stat">
-                <div class="stat-value">{{ total_articles }}</div>
-                <div class="stat-label">Articles Collected</div>
-            </div>
-            <div class="stat">
-                <div class="stat-value">{{ total_categories }}</div>
-                <div class="stat-label">Categories</div>
-            </div>
-            <div class="stat">
-                <div class="stat-value">{{ total_feeds }}</div>
-                <div class="stat-label">RSS Feeds Monitored</div>
-            </div>
-        </div>
-    </div>
-
-    {% for category, articles in by_category.items() %}
-    <div class="category">
-        <div class="category-header">
-            {{ category_icons.get(category, '📰') }} {{ category }}
-        </div>
-        <div class="category-content">
-            {% for article in articles %}
-            <div class="article">
-                <div class="article-title">
-                    <a href="{{ article.link }}" target="_blank">{{ article.title }}</a>
-                </div>
-                <div class="article-meta">
-                    <span class="priority-badge priority-{{ article.priority }}">{{ article.priority }}</span>
-                    <span class="feed-badge">{{ article.feed_name }}</span>
-                    📅 {{ article.published_str }}
-                </div>
-                <div class="article-summary">
-                    {{ article.summary }}
-                </div>
-                {% if article.ai_summary %}
-                <div class="ai-summary">
-                    {{ article.ai_summary }}
-                </div>
-                {% endif %}
-            </div>
-            {% endfor %}
-        </div>
-    </div>
-    {% endfor %}
-
-    <div class="footer">
-        <p>Automatically generated tech watch report</p>
-        <p>{{ generation_time }}</p>
-    </div>
-</body>
-</html>
+    
+    def _load_entry_fingerprints(self):
+        """Load the content fingerprints of entries seen by previous runs, keyed by GUID"""
+        if self.entry_fingerprints is None:
+            self.entry_fingerprints = {}
+            store_path = self._data_path('entry_fingerprints.json')
+            if store_path.exists():
+                try:
+                    with open(store_path, 'r', encoding='utf-8') as f:
+                        self.entry_fingerprints = json.load(f)
+                except Exception as e:
+                    print(f"  Could not load entry fingerprints: {e}")
+        return self.entry_fingerprints
+    
+    def _save_entry_fingerprints(self):
+        """Persist entry fingerprints, dropping entries no longer seen in the feeds"""
+        retention_days = self._change_detection_config()['retention_days']
+        cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat()
+        store = {guid: entry for guid, entry in self.entry_fingerprints.items() if entry['last_seen'] >= cutoff}
+        self.entry_fingerprints = store
+        try:
+            with open(self._data_path('entry_fingerprints.json'), 'w', encoding='utf-8') as f:
+                json.dump(store, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"  Could not save entry fingerprints: {e}")
+    
+    def _processing_settings(self):
+        """Settings the stored summary of an entry was computed with"""
+        output = self.config['output']
+        return hashlib.sha1(json.dumps([
+            output.get('smart_summary', True),
+            output.get('summary_max_length', 300),
+            output.get('summary_keyword_weights')
+        ], sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _simhash(text):
+        """64-bit SimHash of a text's words: near-identical texts differ in few bits"""
+        words, counts = np.unique(re.findall(r'\w+', text.lower()), return_counts=True)
+        if not len(words):
+            return 0
+        
+        hashes = np.array([
+            int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest(), 'little')
+            for word in words
+        ], dtype=np.uint64)
+        # One row per word, one column per bit: each word votes +count/-count on every bit
+        bits = ((hashes[:, None] >> np.arange(64, dtype=np.uint64)) & np.uint64(1)).astype(np.int64)
+        votes = counts @ (bits * 2 - 1)
+        return sum(1 << int(bit) for bit in np.flatnonzero(votes > 0))
+    
+    def _detect_entry_change(self, article, raw_summary, settings):
+        """Classify an entry against its stored fingerprint: new, unchanged, cosmetic or updated
+        
+        Returns the status and the stored entry when its summary can be reused.
+        """
+        store = self._load_entry_fingerprints()
+        threshold = self._change_detection_config()['simhash_threshold']
+        now = datetime.now().isoformat()
+        
+        title = ' '.join(re.findall(r'\w+', article['title'].lower()))
+        content_hash = hashlib.sha1(f"{article['title']}\n{raw_summary}".encode('utf-8')).hexdigest()
+        stored = store.get(article['guid'])
+        
+        if stored is not None and stored['hash'] == content_hash:
+            status = 'unchanged'
+        else:
+            simhash = self._simhash(self._clean_html(raw_summary))
+            if stored is None:
+                status = 'new'
+                stored = store[article['guid']] = {'first_seen': now}
+            else:
+                # Same title words and a near-identical text: markup, whitespace or typo edits
+                distance = bin(simhash ^ int(stored['simhash'], 16)).count('1')
+                status = 'cosmetic' if title == stored['title'] and distance <= threshold else 'updated'
+            
+            if status != 'cosmetic':
+                if status == 'updated':
+                    stored.pop('settings', None)
+                    stored['updated_at'] = now
+                stored['title'] = title
+                stored['simhash'] = format(simhash, '016x')
+        
+        # Cosmetic edits keep the original SimHash so successive small edits still add up
+        stored['hash'] = content_hash
+        stored['last_seen'] = now
+        
+        days_back = self.config['output']['days_back']
+        updated_at = stored.get('updated_at')
+        article['updated'] = bool(updated_at) and updated_at >= (datetime.now() - timedelta(days=days_back)).isoformat()
+        
+        return status, stored if stored.get('settings') == settings else None
+    
+    def _remember_entries(self, articles):
+        """Store the summaries computed for the articles' current content"""
+        store = self._load_entry_fingerprints()
+        settings = self._processing_settings()
+        for article in articles:
+            stored = store.get(article.get('guid'))
+            if stored is None:
+                continue
+            stored.update({
+                'settings': settings,
+                'summary': article['summary'],
+                'ai_summary': article.get('ai_summary')
+            })
+        self._save_entry_fingerprints()
+    
+    def _process_articles(self, pending, enrich=True):
+        """Summarize and enrich newly collected articles
+        
+        Priorities are computed once, by build_report_model, when duplicate groups are known.
+        """
+        # Check if smart summaries are enabled
+        use_smart_summary = self.config['output'].get('smart_summary', True)
+        max_length = self.config['output'].get('summary_max_length', 300)
+        
+        # Entries already processed by a previous run reuse their results unless their content changed
+        reusable = [None] * len(pending)
+        if self._change_detection_config()['enabled']:
+            settings = self._processing_settings()
+            changes = {}
+            statuses = {'new': 0, 'unchanged': 0, 'cosmetic': 0, 'updated': 0}
+            for i, (article, raw_summary) in enumerate(pending):
+                # Categories sharing a feed collect the same entry: classify it once
+                if article['guid'] not in changes:
+                    status, stored = self._detect_entry_change(article, raw_summary, settings)
+                    changes[article['guid']] = (stored, article['updated'])
+                    statuses[status] += 1
+                reusable[i], article['updated'] = changes[article['guid']]
+            print(f"\nEntries: {statuses['new']} new, {statuses['updated']} updated, "
+                  f"{statuses['unchanged'] + statuses['cosmetic']} unchanged ({statuses['cosmetic']} cosmetic edits)")
+        
+        raw_summaries = [raw_summary for (_, raw_summary), stored in zip(pending, reusable) if stored is None]
+        if use_smart_summary:
+            # One batched scoring pass over every article of the run
+            smart_summaries = self._summarize_texts(raw_summaries, max_length=max_length)
+            self._save_summary_cache()
+        else:
+            smart_summaries = [''] * len(raw_summaries)
+        smart_summaries = iter(smart_summaries)
+        
+        for (article, raw_summary), stored in zip(pending, reusable):
+            if stored is not None:
+                article['summary'] = stored['summary']
+                if stored.get('ai_summary'):
+                    article['ai_summary'] = stored['ai_summary']
+            else:
+                smart_summary = next(smart_summaries)
+                article['summary'] = smart_summary if smart_summary else raw_summary[:max_length]
+        
+        for article, _ in pending:
+            # Try OpenAI summary if enabled (the async mode requests them concurrently)
+            if enrich and not article.get('ai_summary'):
+                openai_summary = self._get_openai_summary(article)
+                if openai_summary:
+                    article['ai_summary'] = openai_summary
+            
+            self.articles.append(article)
+        
+        # The async mode stores entries once their AI summaries are in
+        if enrich and self._change_detection_config()['enabled']:
+            self._remember_entries(self.articles)
+    
+    def fetch_feeds(self, documents=None, enrich=True):
+        """Fetch all configured RSS feeds, or process documents downloaded beforehand"""
+        days_back = self.config['output']['days_back']
+        
+        # Several categories filter the same feed (e.g. Azure Updates): download it once
+        parsed_feeds = {}
+        # Collected articles with their raw summaries, processed after all feeds are fetched
+        pending = []
+        # Critical alerts go to this instance's channels, or to each profile's in profile mode
+        if self.profile_alerters is not None:
+            alerters = self.profile_alerters
+        else:
+            alerters = [(None, None, self)] if self._alerts_active() else []
+        
+        for category, feeds in self.config['rss_feeds'].items():
+            print(f"\nProcessing category: {category.upper()}")
+            
+            for feed_config in feeds:
+                feed_name = feed_config['name']
+                feed_url = feed_config['url']
+                keywords = feed_config.get('keywords', [])
+                
+                try:
+                    print(f"  {feed_name}...")
+                    if feed_url not in parsed_feeds:
+                        if documents is not None:
+                            # Downloaded by the async mode: (content, stale) or the download error
+                            document = documents[feed_url]
+                            if isinstance(document, Exception):
+                                raise document
+                            content, stale = document
+                        else:
+                            content, stale = self._fetch_feed(feed_name, feed_url)
+                        entries = self._feed_entries(feed_name, feed_url, content, days_back)
+                        parsed_feeds[feed_url] = (entries, stale)
+                    entries, stale = parsed_feeds[feed_url]
+                    
+                    count = 0
+                    for entry in entries:
+                        published = entry.get('published_parsed') or entry.get('updated_parsed')
+                        
+                        if self._is_recent(published, days_back) and self._matches_keywords(entry, keywords):
+                            article = {
+                                'category': category,
+                                'feed_name': feed_name,
+                                'title': entry.get('title', 'Untitled'),
+                                'link': entry.get('link', '#'),
+                                'summary': '',
+                                'published': published,
+                                'published_str': self._format_date(published),
+                                'stale': stale,
+                                'guid': entry.get('id') or entry.get('link', '#')
+                            }
+                            
+                            # Summaries are computed for all articles at once after fetching
+                            raw_summary = entry.get('summary', entry.get('description', ''))
+                            # Kept so profiles filter on the same text as the fetch-time keyword filter
+                            article['raw_summary'] = raw_summary
+                            pending.append((article, raw_summary))
+                            for profile_keywords, feed_keywords, alerter in alerters:
+                                if profile_keywords is None or alerter._profile_matches(article, profile_keywords, feed_keywords):
+                                    alerter._queue_alert(article)
+                            count += 1
+                    
+                    print(f"  {count} article(s) found" + (" (cached copy)" if stale else ""))
+                    
+                except Exception as e:
+                    error_msg = f"Error with {feed_name}: {str(e)}"
+                    print(f"  {error_msg}")
+                    self.errors.append(error_msg)
+        
+        self._save_feed_health()
+        # Alerts still in their coalescing window go out before summarization and rendering
+        for _, _, alerter in alerters:
+            alerter._flush_alerts()
+        self._process_articles(pending, enrich=enrich)
+        
+        print(f"\nTotal: {len(self.articles)} articles collected")
+        return self.articles
+    
+    def _format_date(self, date_tuple):
+        """Format a date for display"""
+        if not date_tuple:
+            return "Unknown date"
+        try:
+            if isinstance(date_tuple, str):
+                dt = date_parser.parse(date_tuple)
+            else:
+                dt = datetime(*date_tuple[:6])
+            return dt.strftime("%d/%m/%Y %H:%M")
+        except:
+            return "Unknown date"
+    
+    def _prioritize_articles(self):
+        """Group duplicates, then score every article in one batch: the single scoring step
+        
+        The report, the search index and the archive export all use the priorities set here.
         """
+        print("Detecting duplicate articles...")
+        # Groups are recomputed: profile views receive articles grouped with the shared set
+        for article in self.articles:
+            article.pop('duplicate_group', None)
+        self.duplicate_groups = self._detect_duplicates()
+        
+        levels, scores = self._score_articles(self.articles)
+        for article, level, score in zip(self.articles, levels, scores):
+            article['priority'] = level
+            article['priority_score'] = round(float(score), 2)
+        return scores
+    
+    def build_report_model(self):
+        """Compute the sorted, grouped and scored report data shared by all renderers"""
+        # Analyze trends
+        print("\nAnalyzing trends...")
+        self.trends = self._analyze_trends()
+        
+        # Detect duplicates and score, then rank
+        scores = self._prioritize_articles()
+        sorted_articles = [self.articles[i] for i in self._rank_articles(self.articles, scores)]
+        
+        # Get TOP articles for executive summary
+        features = self.config.get('features', {})
+        exec_config = features.get('executive_summary', {})
+        if exec_config.get('enabled', True):
+            top_count = exec_config.get('top_count', 3)
+            self.top_articles = sorted_articles[:top_count]
         
-        # Icons per category
-        category_icons = {
-            'azure_security': '🔒',
-            'azure_architecture': '🏛️',
-            'azure_blog': '☁️',
-            'azure_database': '🗄️',
-            'azure_app_services': '🚀',
-            'terraform': '🏗️',
-            'hashicorp': '⚡',
-            'github_actions': '🐙'
-        }
+        # Group by category
+        by_category = {}
+        for article in sorted_articles:
+            cat = article['category']
+            if cat not in by_category:
+                by_category[cat] = []
+            by_category[cat].append(article)
         
         # Count unique feeds
         unique_feeds = set()
         for article in self.articles:
             unique_feeds.add(article['feed_name'])
         
-        # Generate HTML
-        template = Template(html_template)
-        html = template.render(
-            date=datetime.now().strftime("%m/%d/%Y"),
-            by_category=by_category,
-            total_articles=len(self.articles),
-            total_categories=len(by_category),
-            total_feeds=len(unique_feeds),
-            generation_time=datetime.now().strftime("%m/%d/%Y at %H:%M:%S"),
-            category_icons=category_icons,
-            errors=self.errors,
-            top_articles=self.top_articles,
-            trends=self.trends,
-            duplicate_groups=self.duplicate_groups
+        now = datetime.now()
+        self.report_model = {
+            'date': now.strftime("%m/%d/%Y"),
+            'generation_time': now.strftime("%m/%d/%Y at %H:%M:%S"),
+            'report_path': self._report_path('html'),
+            'sorted_articles': sorted_articles,
+            'by_category': by_category,
+            'top_articles': self.top_articles,
+            'critical_articles': [a for a in sorted_articles if a.get('priority') == 'critical'],
+            'trends': self.trends,
+            'duplicate_groups': self.duplicate_groups,
+            'errors': list(self.errors),
+            'total_articles': len(self.articles),
+            'total_categories': len(by_category),
+            'total_feeds': len(unique_feeds),
+            'category_icons': CATEGORY_ICONS
+        }
+        return self.report_model
+    
+    def generate_report(self):
+        """Generate an HTML report"""
+        return self.render_report(self.build_report_model(), 'html')
+    
+    def render_report(self, model, output_format):
+        """Render a computed report model with the renderer registered for a format"""
+        renderer = REPORT_RENDERERS.get(output_format)
+        if renderer is None:
+            raise ValueError(f"Unknown report format: {output_format}")
+        return getattr(self, renderer['method'])(model)
+    
+    def render_outputs(self, model, formats):
+        """Render several formats of the same report model in parallel"""
+        with ThreadPoolExecutor(max_workers=max(1, len(formats))) as executor:
+            futures = {fmt: executor.submit(self.render_report, model, fmt) for fmt in formats}
+            return {fmt: future.result() for fmt, future in futures.items()}
+    
+    def _template(self, source):
+        """Return a compiled Jinja template, compiling each source only once"""
+        template = self._templates.get(source)
+        if template is None:
+            template = self._templates[source] = Template(source)
+        return template
+    
+    def _fragment_key(self, kind, template_source, data):
+        """Content hash of a fragment's inputs and of the template rendering it"""
+        payload = json.dumps([kind, template_source, data], sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    
+    def _load_fragment_cache(self):
+        """Load rendered HTML fragments from previous runs (kept in memory afterwards)"""
+        if self.fragment_cache is None:
+            self.fragment_cache = {}
+            cache_path = self._data_path('fragment_cache.json')
+            if cache_path.exists():
+                try:
+                    with open(cache_path, 'r', encoding='utf-8') as f:
+                        self.fragment_cache = json.load(f)
+                except Exception as e:
+                    print(f"  Could not load fragment cache: {e}")
+        return self.fragment_cache
+    
+    def _save_fragment_cache(self, fragments):
+        """Persist the fragments used by the last render, dropping stale ones"""
+        self.fragment_cache = fragments
+        cache_path = self._data_path('fragment_cache.json')
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(fragments, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"  Could not save fragment cache: {e}")
+    
+    def _render_html(self, model):
+        """Render the report model as the HTML page, reusing cached fragments"""
+        cache = self._load_fragment_cache()
+        used = {}
+        rendered = 0
+        sections = []
+        
+        for category, articles in model['by_category'].items():
+            article_keys = [
+                self._fragment_key(
+                    'article', ARTICLE_HTML_TEMPLATE, {field: article.get(field) for field in ARTICLE_FRAGMENT_FIELDS}
+                )
+                for article in articles
+            ]
+            icon = model['category_icons'].get(category, '📰')
+            category_key = self._fragment_key(
+                'category', CATEGORY_HTML_TEMPLATE, [category, icon, article_keys]
+            )
+            
+            section = cache.get(category_key)
+            if section is None:
+                # Only the articles of changed categories are looked up or re-rendered
+                article_fragments = []
+                for key, article in zip(article_keys, articles):
+                    fragment = cache.get(key)
+                    if fragment is None:
+                        fragment = self._template(ARTICLE_HTML_TEMPLATE).render(article=article)
+                        rendered += 1
+                    article_fragments.append(fragment)
+                    used[key] = fragment
+                
+                section = self._template(CATEGORY_HTML_TEMPLATE).render(
+                    category=category,
+                    icon=icon,
+                    articles_html='\n'.join(article_fragments)
+                )
+                rendered += 1
+            else:
+                for key in article_keys:
+                    if key in cache:
+                        used[key] = cache[key]
+            
+            used[category_key] = section
+            sections.append(section)
+        
+        self._save_fragment_cache(used)
+        print(f"  HTML fragments: {rendered} rendered, {len(used) - rendered} reused")
+        
+        return self._template(REPORT_HTML_TEMPLATE).render(category_sections=sections, **model)
+    
+    def _render_text(self, model):
+        """Render the report model as plain text (email alternative part)"""
+        lines = [f"TECH WATCH REPORT - {model['date']}", ""]
+        
+        if model['errors']:
+            lines.append("WARNINGS")
+            lines.extend(f"  - {error}" for error in model['errors'])
+            lines.append("")
+        
+        if model['top_articles']:
+            lines.append(f"TOP {len(model['top_articles'])} - MUST READ TODAY")
+            for article in model['top_articles']:
+                lines.append(f"  [{article['priority'].upper()}] {article['title']}")
+                lines.append(f"    {article['link']}")
+            lines.append("")
+        
+        if model['trends']:
+            trends = ', '.join(f"{t['keyword']} ({t['week_count']})" for t in model['trends'])
+            lines.extend([f"TRENDING: {trends}", ""])
+        
+        lines.append(
+            f"{model['total_articles']} articles, {model['total_categories']} categories, "
+            f"{model['total_feeds']} feeds"
         )
         
-        return html
+        for category, articles in model['by_category'].items():
+            lines.extend(["", category.upper(), "-" * len(category)])
+            for article in articles:
+                updated = " (updated)" if article.get('updated') else ""
+                lines.append(f"[{article['priority'].upper()}] {article['title']}{updated}")
+                lines.append(f"  {article['feed_name']} - {article['published_str']}")
+                lines.append(f"  {article['summary']}")
+                lines.append(f"  {article['link']}")
+        
+        lines.extend(["", f"Generated {model['generation_time']}"])
+        return '\n'.join(lines)
     
-    def save_report(self, html):
-        """Save the HTML report"""
-        output_folder = Path(self.config['output']['folder'])
-        output_folder.mkdir(parents=True, exist_ok=True)
+    def _render_markdown(self, model):
+        """Render the report model as Markdown"""
+        lines = [f"# 🔍 Tech Watch Report - {model['date']}", ""]
+        
+        if model['errors']:
+            lines.append("## ⚠️ Warnings")
+            lines.extend(f"- {error}" for error in model['errors'])
+            lines.append("")
+        
+        if model['top_articles']:
+            lines.append(f"## 🔥 TOP {len(model['top_articles'])} - Must Read Today")
+            for article in model['top_articles']:
+                lines.append(f"- **{article['priority'].upper()}** [{article['title']}]({article['link']})")
+            lines.append("")
+        
+        if model['trends']:
+            lines.append("## 📈 Trending Topics This Week")
+            lines.append(' · '.join(f"`{t['keyword']}` ({t['week_count']})" for t in model['trends']))
+            lines.append("")
+        
+        lines.append(
+            f"**{model['total_articles']}** articles · **{model['total_categories']}** categories · "
+            f"**{model['total_feeds']}** feeds"
+        )
         
-        filename = f"tech_watch_{datetime.now().strftime('%Y%m%d')}.html"
-        filepath = output_folder / filename
+        for category, articles in model['by_category'].items():
+            icon = model['category_icons'].get(category, '📰')
+            lines.extend(["", f"## {icon} {category}", ""])
+            for article in articles:
+                lines.append(f"### [{article['title']}]({article['link']})")
+                updated = " · updated" if article.get('updated') else ""
+                lines.append(f"`{article['priority']}` · {article['feed_name']} · {article['published_str']}{updated}")
+                lines.append("")
+                lines.append(article['summary'])
+                if article.get('ai_summary'):
+                    lines.extend(["", f"> 🤖 {article['ai_summary']}"])
+                lines.append("")
+        
+        lines.append(f"_Generated {model['generation_time']}_")
+        return '\n'.join(lines)
+    
+    def _render_json_feed(self, model):
+        """Render the report model as a JSON Feed 1.1 document"""
+        items = []
+        for article in model['sorted_articles']:
+            published = self._article_epoch(article)
+            item = {
+                'id': article['link'],
+                'url': article['link'],
+                'title': article['title'],
+                'content_text': article['summary'],
+                'tags': [article['category'], article['priority']],
+                '_tech_watch': {
+                    'feed_name': article['feed_name'],
+                    'priority_score': article.get('priority_score'),
+                    'duplicate_group': article.get('duplicate_group')
+                }
+            }
+            if published is not None:
+                item['date_published'] = datetime.fromtimestamp(published, timezone.utc).isoformat()
+            if article.get('ai_summary'):
+                item['summary'] = article['ai_summary']
+            items.append(item)
+        
+        feed = {
+            'version': 'https://jsonfeed.org/version/1.1',
+            'title': f"Tech Watch Report - {model['date']}",
+            'items': items
+        }
+        return json.dumps(feed, ensure_ascii=False, indent=2)
+    
+    def _render_chat(self, model):
+        """Render the short Teams/Slack digest for the report"""
+        message = f"📊 Tech Watch Report - {model['total_articles']} articles collected\n"
+        if model['critical_articles']:
+            message += f"🚨 {len(model['critical_articles'])} critical article(s)\n"
+            # Articles already alerted to these channels (see _flush_alerts) are only counted
+            sent = self._load_sent_alerts()
+            for a in model['critical_articles']:
+                if a.get('guid') not in sent:
+                    message += f"• {a['title']}\n  {a['link']}\n"
+        if model['trends']:
+            message += f"🔥 Top trends: {', '.join([t['keyword'] for t in model['trends'][:5]])}\n"
+        message += f"\nView full report: file://{model['report_path']}"
+        return message
+    
+    def _report_path(self, extension):
+        """Return the path of today's report file with the given extension"""
+        output_folder = Path(self.config['output']['folder'])
+        return output_folder / f"tech_watch_{datetime.now().strftime('%Y%m%d')}.{extension}"
+    
+    def save_report(self, html, extension='html'):
+        """Save a rendered report"""
+        filepath = self._report_path(extension)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(html)
         
+        # Keep the reports index current so cleanup never has to scan the folder
+        index = self._load_reports_index()
+        index[filepath.name] = {
+            'date': datetime.now().strftime('%Y-%m-%d'),
+            'size': filepath.stat().st_size,
+            'archived': False
+        }
+        self._save_reports_index(index)
+        
         print(f"\nReport saved: {filepath.absolute()}")
         return filepath
     
+    def _export_folder(self):
+        """Return the root folder of the columnar article archive"""
+        export_config = self.config.get('features', {}).get('archive_export', {})
+        default_folder = Path(self.config['output'].get('data_folder', './data')) / 'archive'
+        return Path(export_config.get('folder', default_folder))
+    
+    def _export_format(self):
+        """Return 'parquet' when pyarrow is available (or forced), else 'jsonl'"""
+        export_config = self.config.get('features', {}).get('archive_export', {})
+        requested = export_config.get('format', 'auto')
+        if requested == 'jsonl':
+            return 'jsonl'
+        try:
+            import pyarrow  # noqa: F401
+            return 'parquet'
+        except ImportError:
+            if requested == 'parquet':
+                print("  pyarrow not installed, exporting as gzip JSONL instead")
+            return 'jsonl'
+    
+    def _archive_schema(self):
+        """Arrow schema of the columnar article archive"""
+        import pyarrow as pa
+        return pa.schema([
+            ('link', pa.string()),
+            ('title', pa.string()),
+            ('summary', pa.string()),
+            ('category', pa.string()),
+            ('feed_name', pa.string()),
+            ('priority', pa.string()),
+            ('priority_score', pa.float64()),
+            ('published_epoch', pa.int64()),
+            ('collected_epoch', pa.int64()),
+            ('duplicate_group', pa.string()),
+            ('run_id', pa.string())
+        ])
+    
+    def _read_export_file(self, path, columns=None):
+        """Read the records of one archive part file"""
+        if path.suffix == '.parquet':
+            import pyarrow.parquet as pq
+            return pq.read_table(path, columns=columns).to_pylist()
+        
+        records = []
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                if columns:
+                    record = {k: record.get(k) for k in columns}
+                records.append(record)
+        return records
+    
+    def export_articles(self):
+        """Append this run's articles to the date/category partitioned archive"""
+        features = self.config.get('features', {})
+        export_config = features.get('archive_export', {})
+        
+        if not export_config.get('enabled', False) or not self.articles:
+            return 0
+        
+        export_format = self._export_format()
+        root = self._export_folder()
+        run_id = datetime.now().strftime('%Y%m%dT%H%M%S')
+        collected = int(time.time())
+        
+        # Group records by hive-style partition: date=YYYY-MM-DD/category=<name>
+        partitions = {}
+        for article in self.articles:
+            published = self._article_epoch(article)
+            day = datetime.fromtimestamp(published if published is not None else collected, timezone.utc)
+            key = (day.strftime('%Y-%m-%d'), article.get('category', 'unknown'))
+            partitions.setdefault(key, []).append({
+                'link': article.get('link', ''),
+                'title': article.get('title', ''),
+                'summary': article.get('summary', ''),
+                'category': article.get('category', ''),
+                'feed_name': article.get('feed_name', ''),
+                'priority': article.get('priority', ''),
+                'priority_score': float(article.get('priority_score', 0) or 0),
+                'published_epoch': published,
+                'collected_epoch': collected,
+                'duplicate_group': article.get('duplicate_group'),
+                'run_id': run_id
+            })
+        
+        written = 0
+        try:
+            for (day, category), records in partitions.items():
+                partition = root / f"date={day}" / f"category={category}"
+                partition.mkdir(parents=True, exist_ok=True)
+                
+                # Overlapping days_back windows see the same articles again:
+                # only append links the partition does not hold yet
+                known = set()
+                for part in partition.glob('part-*'):
+                    known.update(r['link'] for r in self._read_export_file(part, columns=['link']))
+                records = [r for r in records if r['link'] not in known]
+                if not records:
+                    continue
+                
+                if export_format == 'parquet':
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                    table = pa.Table.from_pylist(records, schema=self._archive_schema())
+                    pq.write_table(table, partition / f"part-{run_id}.parquet", compression='zstd')
+                else:
+                    with gzip.open(partition / f"part-{run_id}.jsonl.gz", 'wt', encoding='utf-8') as f:
+                        for record in records:
+                            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                
+                written += len(records)
+        except Exception as e:
+            error_msg = f"Archive export error: {e}"
+            print(f"  {error_msg}")
+            self.errors.append(error_msg)
+        
+        print(f"Archive export: {written} new article(s) written as {export_format}")
+        return written
+    
+    def read_archive(self, since=None, until=None, categories=None, columns=None):
+        """Read archived articles, pruning partitions by date and category"""
+        root = self._export_folder()
+        if not root.exists():
+            return []
+        
+        since = date_parser.parse(since).strftime('%Y-%m-%d') if since else None
+        until = date_parser.parse(until).strftime('%Y-%m-%d') if until else None
+        categories = set(categories) if categories else None
+        
+        records = []
+        for date_dir in sorted(root.glob('date=*')):
+            day = date_dir.name.split('=', 1)[1]
+            # ISO dates compare correctly as strings
+            if (since and day < since) or (until and day > until):
+                continue
+            for category_dir in date_dir.glob('category=*'):
+                if categories and category_dir.name.split('=', 1)[1] not in categories:
+                    continue
+                for part in sorted(category_dir.glob('part-*')):
+                    records.extend(self._read_export_file(part, columns=columns))
+        
+        return records
+    
+    def _reports_index_path(self):
+        """Return the path of the index of saved and archived reports"""
+        return Path(self.config['output']['folder']) / 'index.json'
+    
+    def _load_reports_index(self):
+        """Load the reports index, building it from the report folder the first time"""
+        index_path = self._reports_index_path()
+        if index_path.exists():
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"  Could not load reports index, rebuilding it: {e}")
+        
+        index = {}
+        if index_path.parent.exists():
+            for file in index_path.parent.glob("tech_watch_*.*"):
+                match = re.match(r'tech_watch_(\d{4})(\d{2})(\d{2})\.', file.name)
+                if match:
+                    index[file.name] = {'date': '-'.join(match.groups()), 'size': file.stat().st_size, 'archived': False}
+        return index
+    
+    def _save_reports_index(self, index):
+        """Persist the reports index"""
+        index_path = self._reports_index_path()
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(index.items())), f, indent=2)
+    
+    def _open_reports_archive(self):
+        """Open the compressed report archive, creating the schema if needed"""
+        archive_path = Path(self.config['output']['folder']) / 'reports_archive.db'
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(archive_path)
+        conn.row_factory = sqlite3.Row
+        conn.executescript("""
+            -- Shared zlib dictionaries (the report stylesheet), referenced by their id
+            CREATE TABLE IF NOT EXISTS dictionaries (
+                id TEXT PRIMARY KEY,
+                data BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS reports (
+                name TEXT PRIMARY KEY,
+                day TEXT NOT NULL,
+                dict_id TEXT REFERENCES dictionaries(id),
+                size INTEGER,
+                data BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_reports_day ON reports(day);
+        """)
+        return conn
+    
+    def _report_dictionary(self, conn, names):
+        """Return (id, data) of the zlib dictionary used to compress reports, or (None, None)
+        
+        Reports of every day share the same inline stylesheet: it is stored once and
+        preset as the compression dictionary of each archived report.
+        """
+        folder = Path(self.config['output']['folder'])
+        for name in names:
+            if name.endswith('.html') and (folder / name).exists():
+                match = re.search(r'<style>.*?</style>', (folder / name).read_text(encoding='utf-8'), re.S)
+                if match:
+                    # zlib only looks back 32 KB: a longer dictionary would be partly unused
+                    data = match.group(0).encode('utf-8')[-32768:]
+                    dict_id = hashlib.sha1(data).hexdigest()[:12]
+                    conn.execute("INSERT OR IGNORE INTO dictionaries (id, data) VALUES (?, ?)", (dict_id, data))
+                    return dict_id, data
+        
+        # No HTML report in this batch: reuse the latest dictionary
+        row = conn.execute("SELECT id, data FROM dictionaries ORDER BY rowid DESC LIMIT 1").fetchone()
+        return (row['id'], row['data']) if row else (None, None)
+    
+    def _archive_reports(self, names, index):
+        """Move reports into the compressed archive"""
+        folder = Path(self.config['output']['folder'])
+        conn = self._open_reports_archive()
+        archived = []
+        try:
+            with conn:
+                dict_id, zdict = self._report_dictionary(conn, names)
+                for name in names:
+                    path = folder / name
+                    if not path.exists():
+                        index.pop(name, None)
+                        continue
+                    
+                    data = path.read_bytes()
+                    compressor = zlib.compressobj(9, zdict=zdict) if zdict else zlib.compressobj(9)
+                    blob = compressor.compress(data) + compressor.flush()
+                    conn.execute(
+                        "INSERT OR REPLACE INTO reports (name, day, dict_id, size, data) VALUES (?, ?, ?, ?, ?)",
+                        (name, index[name]['date'], dict_id if zdict else None, len(data), blob)
+                    )
+                    index[name].update({'archived': True, 'dict_id': dict_id if zdict else None, 'compressed_size': len(blob)})
+                    archived.append(path)
+        finally:
+            conn.close()
+        
+        # Files are only removed once the archive transaction is committed
+        for path in archived:
+            path.unlink()
+        return len(archived)
+    
+    def _purge_archived_reports(self, names, index):
+        """Delete archived reports past the archive retention period"""
+        conn = self._open_reports_archive()
+        try:
+            with conn:
+                conn.executemany("DELETE FROM reports WHERE name = ?", [(name,) for name in names])
+                # Dictionaries no longer referenced by any report
+                conn.execute("DELETE FROM dictionaries WHERE id NOT IN (SELECT dict_id FROM reports WHERE dict_id IS NOT NULL)")
+        finally:
+            conn.close()
+        for name in names:
+            index.pop(name, None)
+        return len(names)
+    
     def cleanup_old_reports(self):
-        """Delete old reports"""
+        """Archive reports past the retention period, or delete them when archiving is disabled"""
         output_folder = Path(self.config['output']['folder'])
         retention_days = self.config['output']['retention_days']
-        cutoff_date = datetime.now() - timedelta(days=retention_days)
+        archive_reports = self.config['output'].get('archive_reports', True)
+        archive_retention_days = self.config['output'].get('archive_retention_days', 365)
         
         if not output_folder.exists():
             return
         
-        deleted = 0
-        for file in output_folder.glob("tech_watch_*.html"):
-            if file.stat().st_mtime < cutoff_date.timestamp():
-                file.unlink()
+        # ISO dates compare correctly as strings
+        cutoff = (datetime.now() - timedelta(days=retention_days)).strftime('%Y-%m-%d')
+        index = self._load_reports_index()
+        expired = [name for name, entry in index.items() if not entry['archived'] and entry['date'] < cutoff]
+        
+        archived = deleted = purged = 0
+        if expired and archive_reports:
+            archived = self._archive_reports(expired, index)
+        elif expired:
+            for name in expired:
+                (output_folder / name).unlink(missing_ok=True)
+                index.pop(name)
                 deleted += 1
         
-        if deleted > 0:
-            print(f"{deleted} old report(s) deleted")
+        if archive_retention_days:
+            archive_cutoff = (datetime.now() - timedelta(days=archive_retention_days)).strftime('%Y-%m-%d')
+            outdated = [name for name, entry in index.items() if entry['archived'] and entry['date'] < archive_cutoff]
+            if outdated:
+                purged = self._purge_archived_reports(outdated, index)
+        
+        if archived or deleted or purged:
+            self._save_reports_index(index)
+        if archived > 0:
+            print(f"{archived} old report(s) archived")
+        if deleted + purged > 0:
+            print(f"{deleted + purged} old report(s) deleted")
     
-    def send_email(self, html, filepath):
-        """Send the report via email using Gmail SMTP"""
+    def load_report(self, day, extension='html'):
+        """Return the content of a past report, from the report folder or the archive"""
+        name = f"tech_watch_{date_parser.parse(day).strftime('%Y%m%d')}.{extension}"
+        entry = self._load_reports_index().get(name)
+        if entry is None:
+            return None
+        
+        if not entry['archived']:
+            return (Path(self.config['output']['folder']) / name).read_text(encoding='utf-8')
+        
+        conn = self._open_reports_archive()
+        try:
+            row = conn.execute("""
+                SELECT r.data, d.data AS zdict
+                FROM reports r LEFT JOIN dictionaries d ON d.id = r.dict_id
+                WHERE r.name = ?
+            """, (name,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        
+        decompressor = zlib.decompressobj(zdict=row['zdict']) if row['zdict'] else zlib.decompressobj()
+        return (decompressor.decompress(row['data']) + decompressor.flush()).decode('utf-8')
+    
+    def _article_epoch(self, article):
+        """Return the publication date of an article as a UTC epoch, or None"""
+        published = article.get('published')
+        if not published:
+            return None
+        try:
+            if isinstance(published, str):
+                return int(date_parser.parse(published).timestamp())
+            return int(calendar.timegm(tuple(published[:6]) + (0, 0, 0)))
+        except Exception:
+            return None
+    
+    def _open_archive(self):
+        """Open the article archive database, creating the schema if needed"""
+        conn = sqlite3.connect(self._data_path('archive.db'))
+        conn.row_factory = sqlite3.Row
+        
+        # Archives created before the entry text was indexed: add the column and rebuild the FTS table
+        columns = [row['name'] for row in conn.execute("PRAGMA table_info(articles)")]
+        migrate = bool(columns) and 'content' not in columns
+        if migrate:
+            conn.executescript("""
+                ALTER TABLE articles ADD COLUMN content TEXT;
+                DROP TRIGGER IF EXISTS articles_ai;
+                DROP TRIGGER IF EXISTS articles_ad;
+                DROP TRIGGER IF EXISTS articles_au;
+                DROP TABLE IF EXISTS articles_fts;
+            """)
+        
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY,
+                link TEXT UNIQUE NOT NULL,
+                title TEXT,
+                summary TEXT,
+                content TEXT,
+                category TEXT,
+                feed_name TEXT,
+                priority TEXT,
+                priority_score REAL,
+                published INTEGER,
+                first_seen INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published);
+            CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category);
+            CREATE INDEX IF NOT EXISTS idx_articles_feed ON articles(feed_name);
+            CREATE INDEX IF NOT EXISTS idx_articles_priority ON articles(priority);
+            
+            -- content is the whole cleaned entry, summary only the extract shown in reports
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                title, summary, content,
+                content='articles', content_rowid='id',
+                tokenize='porter unicode61'
+            );
+            
+            -- Keep the external-content FTS table in sync with the articles table
+            CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_fts(rowid, title, summary, content)
+                VALUES (new.id, new.title, new.summary, new.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, summary, content)
+                VALUES ('delete', old.id, old.title, old.summary, old.content);
+            END;
+            -- Priority changes alone leave the full-text index untouched
+            CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE OF title, summary, content ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, summary, content)
+                VALUES ('delete', old.id, old.title, old.summary, old.content);
+                INSERT INTO articles_fts(rowid, title, summary, content)
+                VALUES (new.id, new.title, new.summary, new.content);
+            END;
+        """)
+        if migrate:
+            with conn:
+                conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+        return conn
+    
+    def index_articles(self):
+        """Add collected articles to the full-text search archive"""
+        features = self.config.get('features', {})
+        index_config = features.get('search_index', {})
+        
+        if not index_config.get('enabled', True) or not self.articles:
+            return 0
+        
+        now = int(time.time())
+        rows = [
+            (
+                a.get('link', '#'),
+                a.get('title', ''),
+                a.get('summary', ''),
+                # The whole entry, so terms outside the summary extract stay searchable
+                self._clean_html(a.get('raw_summary', '')),
+                a.get('category', ''),
+                a.get('feed_name', ''),
+                a.get('priority', ''),
+                a.get('priority_score'),
+                self._article_epoch(a),
+                now
+            )
+            for a in self.articles
+            if a.get('link') and a.get('link') != '#'
+        ]
+        
+        try:
+            conn = self._open_archive()
+            with conn:
+                # Only rewrite rows whose content changed so reruns stay cheap
+                # and first_seen keeps the date an article first appeared
+                cursor = conn.executemany("""
+                    INSERT INTO articles
+                        (link, title, summary, content, category, feed_name, priority,
+                         priority_score, published, first_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(link) DO UPDATE SET
+                        title = excluded.title,
+                        summary = excluded.summary,
+                        content = excluded.content,
+                        priority = excluded.priority,
+                        priority_score = excluded.priority_score,
+                        published = COALESCE(excluded.published, articles.published)
+                    WHERE articles.title IS NOT excluded.title
+                       OR articles.summary IS NOT excluded.summary
+                       OR articles.content IS NOT excluded.content
+                       OR articles.priority IS NOT excluded.priority
+                       OR articles.priority_score IS NOT excluded.priority_score
+                """, rows)
+                changed = cursor.rowcount
+            conn.close()
+        except sqlite3.Error as e:
+            error_msg = f"Search index error: {e}"
+            print(f"  {error_msg}")
+            self.errors.append(error_msg)
+            return 0
+        
+        print(f"Search index updated: {changed} article(s) added or changed")
+        return changed
+    
+    def _build_fts_query(self, query):
+        """Quote each search term so user input never breaks FTS5 syntax"""
+        terms = re.findall(r'"[^"]+"|\S+', query)
+        quoted = []
+        for term in terms:
+            # A trailing * stays outside the quotes to keep prefix search
+            prefix = '*' if term.endswith('*') and not term.startswith('"') else ''
+            term = term.rstrip('*') if prefix else term
+            term = term.strip('"').replace('"', '""')
+            if term:
+                quoted.append(f'"{term}"{prefix}')
+        return ' '.join(quoted)
+    
+    def search_articles(self, query, category=None, feed=None, priority=None,
+                        since=None, until=None, limit=20, raw=False):
+        """Search the article archive, best matches first"""
+        match = query if raw else self._build_fts_query(query)
+        if not match:
+            return []
+        
+        sql = """
+            SELECT a.*, bm25(articles_fts, 10.0, 1.0, 0.5) AS rank
+            FROM articles_fts
+            JOIN articles a ON a.id = articles_fts.rowid
+            WHERE articles_fts MATCH ?
+        """
+        params = [match]
+        
+        if category:
+            sql += " AND a.category = ?"
+            params.append(category)
+        if feed:
+            sql += " AND a.feed_name = ?"
+            params.append(feed)
+        if priority:
+            sql += " AND a.priority = ?"
+            params.append(priority)
+        if since:
+            sql += " AND COALESCE(a.published, a.first_seen) >= ?"
+            params.append(int(date_parser.parse(since).timestamp()))
+        if until:
+            sql += " AND COALESCE(a.published, a.first_seen) < ?"
+            params.append(int((date_parser.parse(until) + timedelta(days=1)).timestamp()))
+        
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        
+        conn = self._open_archive()
+        try:
+            return [dict(row) for row in conn.execute(sql, params)]
+        finally:
+            conn.close()
+    
+    def _email_message(self, html, text=None):
+        """Build the report email, or return None when email is not configured"""
         email_config = self.config.get('email', {})
         
         # Check if email is configured
@@ -900,21 +2719,45 @@ class TechWatch:
         if not all([to_email, smtp_server, smtp_username, smtp_password]):
             print("\nEmail not configured. Skipping email sending.")
             print("To enable email, configure SMTP settings in config.yaml")
+            return None
+        
+        # Create message
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = f"Tech Watch Report - {datetime.now().strftime('%m/%d/%Y')}"
+        msg['From'] = email_config.get('from_email', smtp_username)
+        msg['To'] = to_email
+        
+        # Attach plain-text alternative first: clients prefer the last part
+        if text:
+            msg.attach(MIMEText(text, 'plain'))
+        
+        # Attach HTML content
+        html_part = MIMEText(html, 'html')
+        msg.attach(html_part)
+        
+        return msg
+    
+    def _print_email_auth_help(self):
+        """Explain the usual cause of SMTP authentication failures"""
+        print("\nEmail authentication failed!")
+        print("For Gmail: Make sure you're using an 'App Password', not your regular password")
+        print("Generate one at: https://myaccount.google.com/apppasswords")
+    
+    def send_email(self, html, filepath, text=None):
+        """Send the report via email using Gmail SMTP"""
+        msg = self._email_message(html, text)
+        if msg is None:
             return False
         
+        email_config = self.config.get('email', {})
+        to_email = email_config['to']
+        smtp_server = email_config['smtp_server']
+        smtp_username = email_config['smtp_username']
+        smtp_password = email_config['smtp_password']
+        
         try:
             print(f"\nSending email to {to_email}...")
             
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = f"Tech Watch Report - {datetime.now().strftime('%m/%d/%Y')}"
-            msg['From'] = email_config.get('from_email', smtp_username)
-            msg['To'] = to_email
-            
-            # Attach HTML content
-            html_part = MIMEText(html, 'html')
-            msg.attach(html_part)
-            
             # Connect to Gmail SMTP server
             smtp_port = email_config.get('smtp_port', 587)
             server = smtplib.SMTP(smtp_server, smtp_port)
@@ -929,69 +2772,648 @@ class TechWatch:
             return True
             
         except smtplib.SMTPAuthenticationError:
-            print("\nEmail authentication failed!")
-            print("For Gmail: Make sure you're using an 'App Password', not your regular password")
-            print("Generate one at: https://myaccount.google.com/apppasswords")
+            self._print_email_auth_help()
             return False
         except Exception as e:
             print(f"\nError sending email: {e}")
             return False
     
-    def run(self):
-        """Run the complete tech watch"""
-        print("=" * 60)
-        print("Starting mastermaint tech watch")
-        print("=" * 60)
+    def _render_and_save(self):
+        """Compute the report model, render every format and save the report files"""
+        # Compute the report once, then render every output format from it
+        print("\nGenerating reports...")
+        model = self.build_report_model()
+        formats = ['html', 'text', 'chat'] + [
+            fmt for fmt in self.config['output'].get('formats', []) if fmt not in ('html', 'text', 'chat')
+        ]
+        outputs = self.render_outputs(model, formats)
+        
+        # Save
+        filepath = self.save_report(outputs['html'])
+        for fmt in formats:
+            if fmt in self.config['output'].get('formats', []) and fmt != 'html':
+                self.save_report(outputs[fmt], extension=REPORT_RENDERERS[fmt]['extension'])
+        self.export_articles()
+        
+        return model, outputs, filepath
+    
+    def deliver(self):
+        """Render, save and send the report for the collected articles"""
+        model, outputs, filepath = self._render_and_save()
+        
+        # Send email if configured
+        self.send_email(outputs['html'], filepath, text=outputs['text'])
+        
+        # Send Teams/Slack notifications if enabled
+        if self.top_articles:
+            is_critical = bool(model['critical_articles'])
+            self._send_to_teams(outputs['chat'], is_critical=is_critical)
+            self._send_to_slack(outputs['chat'], is_critical=is_critical)
+        
+        return filepath
+    
+    @staticmethod
+    def _merge_config(base, override):
+        """Recursively merge an override mapping into a copy of a base configuration"""
+        merged = dict(base)
+        for key, value in (override or {}).items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = TechWatch._merge_config(merged[key], value)
+            else:
+                merged[key] = value
+        return merged
+    
+    def _profile_configs(self):
+        """Build the full configuration of every profile declared in config.yaml"""
+        base = {k: v for k, v in self.config.items() if k != 'profiles'}
+        base_data_folder = Path(base['output'].get('data_folder', './data'))
+        base_folder = Path(base['output']['folder'])
+        
+        profiles = []
+        for profile in self.config.get('profiles', []):
+            name = profile['name']
+            config = base
+            # Output and export settings set by the profile itself, as opposed to inherited ones
+            profile_output = {}
+            profile_export = {}
+            
+            # A profile can point to a team's own config.yaml...
+            if profile.get('config'):
+                team_config_path = os.path.join(os.path.dirname(self.config_path), profile['config'])
+                team_config = self._load_config(team_config_path)
+                profile_output.update(team_config.get('output') or {})
+                profile_export.update((team_config.get('features') or {}).get('archive_export') or {})
+                config = self._merge_config(config, team_config)
+            
+            # ...and/or override settings inline
+            overrides = {k: v for k, v in profile.items() if k not in ('name', 'config', 'keywords')}
+            profile_output.update(overrides.get('output') or {})
+            profile_export.update((overrides.get('features') or {}).get('archive_export') or {})
+            config = self._merge_config(config, overrides)
+            
+            # Per-profile reports and state (trend history, caches, report index) never collide
+            # between teams: profiles are delivered in parallel
+            if 'folder' not in profile_output:
+                config['output'] = dict(config['output'], folder=str(base_folder / name))
+            if 'data_folder' not in profile_output:
+                config['output'] = dict(config['output'], data_folder=str(base_data_folder / 'profiles' / name))
+            if 'folder' not in profile_export and 'archive_export' in config.get('features', {}):
+                # An inherited archive folder would have every profile write the same part files
+                export_config = {k: v for k, v in config['features']['archive_export'].items() if k != 'folder'}
+                config['features'] = dict(config['features'], archive_export=export_config)
+            
+            profiles.append((name, profile.get('keywords', []), config))
+        
+        return profiles
+    
+    def _union_feeds(self, profiles):
+        """Merge the feeds of all profiles so each feed is fetched once"""
+        union = {}
+        for _, _, config in profiles:
+            for category, feeds in config.get('rss_feeds', {}).items():
+                for feed_config in feeds:
+                    key = (category, feed_config['name'], feed_config['url'])
+                    keywords = feed_config.get('keywords', [])
+                    if key not in union:
+                        union[key] = list(keywords)
+                    elif not union[key] or not keywords:
+                        # One profile takes the whole feed: fetch it unfiltered
+                        union[key] = []
+                    else:
+                        union[key].extend(k for k in keywords if k not in union[key])
+        
+        rss_feeds = {}
+        for (category, name, url), keywords in union.items():
+            rss_feeds.setdefault(category, []).append({'name': name, 'url': url, 'keywords': keywords})
+        return rss_feeds
+    
+    @staticmethod
+    def _feed_keywords(config):
+        """Map each (category, feed name) of a configuration to its feed keywords"""
+        return {
+            (category, feed_config['name']): feed_config.get('keywords', [])
+            for category, feeds in config.get('rss_feeds', {}).items()
+            for feed_config in feeds
+        }
+    
+    def _profile_matches(self, article, keywords, feed_keywords):
+        """Check if a shared article belongs to a profile: one of its feeds, its feed keywords and keywords"""
+        key = (article['category'], article['feed_name'])
+        if key not in feed_keywords:
+            return False
+        # The entry text, not the shortened summary, as a standalone run of the profile would see it
+        entry = {'title': article['title'], 'summary': article.get('raw_summary', article['summary'])}
+        return self._matches_keywords(entry, feed_keywords[key]) and self._matches_keywords(entry, keywords)
+    
+    def _profile_view(self, name, keywords, config):
+        """Create a profile's TechWatch over the shared articles, without refetching"""
+        view = TechWatch(self.config_path, config=config)
+        view.errors = list(self.errors)
+        
+        feed_keywords = self._feed_keywords(config)
+        for article in self.articles:
+            if view._profile_matches(article, keywords, feed_keywords):
+                # Articles are copied: each profile scores them with its own priority rules
+                view.articles.append(dict(article))
+        
+        print(f"Profile {name}: {len(view.articles)} article(s)")
+        return view
+    
+    def _run_profile(self, name, keywords, config):
+        """Deliver one profile's report from the shared articles"""
+        view = self._profile_view(name, keywords, config)
+        if not view.articles:
+            print(f"Profile {name}: no matching articles")
+            return None
+        filepath = view.deliver()
+        view.cleanup_old_reports()
+        return filepath
+    
+    def _prepare_profiles(self):
+        """Resolve all profiles and point this instance at the union of their feeds"""
+        profiles = self._profile_configs()
+        self.config['rss_feeds'] = self._union_feeds(profiles)
+        
+        # Each profile alerts its own channels with its own rules and sent-alert store while fetching
+        self.profile_alerters = []
+        for _, keywords, config in profiles:
+            alerter = TechWatch(self.config_path, config=config)
+            alerter.started_at = self.started_at
+            if alerter._alerts_active():
+                self.profile_alerters.append((keywords, self._feed_keywords(config), alerter))
+        return profiles
+    
+    def run_profiles(self):
+        """Fetch the union of all profiles' feeds once, then deliver every profile in parallel"""
+        profiles = self._prepare_profiles()
         
-        # Fetch feeds
         self.fetch_feeds()
         
         if len(self.articles) == 0:
             print("\nNo recent articles found")
-            return None
+            return {}
+        
+        # The shared article set is scored with the base rules and indexed once for all profiles
+        self._prioritize_articles()
+        self.index_articles()
+        
+        print(f"\nDelivering {len(profiles)} profile(s)...")
+        max_workers = self.config.get('profiles_max_workers', 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(self._run_profile, name, keywords, config)
+                       for name, keywords, config in profiles}
+        
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"Profile {name} failed: {e}")
+                results[name] = None
+        return results
+    
+    def _async_config(self):
+        """Return the async I/O mode settings with their defaults"""
+        async_config = self.config.get('features', {}).get('async_io', {})
+        return {
+            'enabled': async_config.get('enabled', False),
+            'max_concurrency': async_config.get('max_concurrency', 10),
+            'per_host_concurrency': async_config.get('per_host_concurrency', 2),
+            'http2': async_config.get('http2', True)
+        }
+    
+    def _open_http_client(self):
+        """Create the pooled HTTP client of the async mode"""
+        # httpx (HTTP/2 when h2 is installed) if available, else a pooled requests
+        # session driven from worker threads
+        async_config = self._async_config()
+        fetcher = self._fetcher_config()
+        try:
+            import httpx
+        except ImportError:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=async_config['max_concurrency'])
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            return session
+        
+        return httpx.AsyncClient(
+            http2=async_config['http2'] and importlib.util.find_spec('h2') is not None,
+            timeout=httpx.Timeout(fetcher['read_timeout'], connect=fetcher['connect_timeout']),
+            limits=httpx.Limits(max_connections=async_config['max_concurrency']),
+            follow_redirects=True
+        )
+    
+    async def _close_http_client(self):
+        """Close the pooled HTTP client of the async mode"""
+        if isinstance(self.http_client, requests.Session):
+            self.http_client.close()
+        elif self.http_client is not None:
+            await self.http_client.aclose()
+        self.http_client = None
+    
+    async def _http_request(self, method, url, **kwargs):
+        """Send a request through the shared client within the global concurrency limit"""
+        async with self.io_limit:
+            if isinstance(self.http_client, requests.Session):
+                fetcher = self._fetcher_config()
+                return await asyncio.to_thread(
+                    self.http_client.request, method, url,
+                    timeout=(fetcher['connect_timeout'], fetcher['read_timeout']), **kwargs
+                )
+            return await self.http_client.request(method, url, **kwargs)
+    
+    async def _fetch_feed_async(self, feed_name, url):
+        """Async counterpart of _fetch_feed sharing its circuit breaker and cache"""
+        host = urlparse(url).netloc
+        if not host:
+            return await asyncio.to_thread(Path(url).read_bytes), False
+        
+        # Few requests per host at a time, so an open breaker still skips most of its feeds
+        async with self.host_limits.setdefault(host, asyncio.Semaphore(self._async_config()['per_host_concurrency'])):
+            error = None
+            if self._host_is_open(host):
+                error = f"circuit open for {host}"
+            else:
+                start = time.perf_counter()
+                host_failure = True
+                try:
+                    response = await self._http_request('GET', url, headers=self._feed_request_headers(url))
+                    if response.status_code >= 400:
+                        host_failure = response.status_code >= 500
+                        raise RuntimeError(f"HTTP {response.status_code} for url: {url}")
+                    content = self._store_feed_response(url, response)
+                    self._record_fetch(url, host, (time.perf_counter() - start) * 1000)
+                    return content, False
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+                    self._record_fetch(url, host, (time.perf_counter() - start) * 1000, error, host_failure)
+        
+        return self._stale_feed(feed_name, url, error)
+    
+    async def fetch_feeds_async(self):
+        """Download every feed concurrently, then parse and summarize them off the event loop"""
+        feed_names = {}
+        for feeds in self.config['rss_feeds'].values():
+            for feed_config in feeds:
+                feed_names.setdefault(feed_config['url'], feed_config['name'])
         
-        # Generate report
-        print("\nGenerating HTML report...")
-        html = self.generate_report()
+        print(f"\nDownloading {len(feed_names)} feed(s) concurrently...")
+        results = await asyncio.gather(
+            *(self._fetch_feed_async(name, url) for url, name in feed_names.items()),
+            return_exceptions=True
+        )
+        documents = dict(zip(feed_names, results))
         
-        # Save
-        filepath = self.save_report(html)
+        # Parsing and summarization are CPU-bound: keep them off the event loop
+        await asyncio.to_thread(self.fetch_feeds, documents, False)
+        await self._enrich_articles_async()
+        if self._change_detection_config()['enabled']:
+            self._remember_entries(self.articles)
+        return self.articles
+    
+    async def _enrich_articles_async(self):
+        """Request OpenAI summaries for all articles concurrently"""
+        # Articles unchanged since a previous run already carry their stored AI summary
+        requests_by_article = [(a, self._openai_request(a)) for a in self.articles if not a.get('ai_summary')]
+        requests_by_article = [(a, r) for a, r in requests_by_article if r is not None]
+        if not requests_by_article:
+            return
         
-        # Send email if configured
-        self.send_email(html, filepath)
+        try:
+            from openai import AsyncOpenAI
+        except ImportError as e:
+            print(f"  OpenAI error: {e}")
+            return
         
-        # Send Teams/Slack notifications if enabled
+        client = AsyncOpenAI(api_key=requests_by_article[0][1][0])
+        
+        async def summarize(article, arguments):
+            async with self.io_limit:
+                try:
+                    response = await client.chat.completions.create(**arguments)
+                    article['ai_summary'] = response.choices[0].message.content
+                except Exception as e:
+                    print(f"  OpenAI error: {e}")
+        
+        await asyncio.gather(*(summarize(a, arguments) for a, (_, arguments) in requests_by_article))
+        await client.close()
+    
+    async def _send_webhook_async(self, channel, content, is_critical=False):
+        """Async counterpart of _send_to_teams / _send_to_slack"""
+        webhook = self._webhook_message(channel, content, is_critical)
+        if webhook is None:
+            return False
+        
+        try:
+            webhook_url, message = webhook
+            response = await self._http_request('POST', webhook_url, json=message)
+            return response.status_code == 200
+        except Exception as e:
+            print(f"  {channel.capitalize()} error: {e}")
+            return False
+    
+    async def send_email_async(self, html, filepath, text=None):
+        """Send the report email with aiosmtplib, or send_email in a worker thread"""
+        try:
+            import aiosmtplib
+        except ImportError:
+            return await asyncio.to_thread(self.send_email, html, filepath, text)
+        
+        msg = self._email_message(html, text)
+        if msg is None:
+            return False
+        
+        email_config = self.config.get('email', {})
+        try:
+            print(f"\nSending email to {email_config['to']}...")
+            async with self.io_limit:
+                await aiosmtplib.send(
+                    msg,
+                    hostname=email_config['smtp_server'],
+                    port=email_config.get('smtp_port', 587),
+                    start_tls=True,
+                    username=email_config['smtp_username'],
+                    password=email_config['smtp_password']
+                )
+            print(f"Email sent successfully to {email_config['to']}!")
+            return True
+        except aiosmtplib.SMTPAuthenticationError:
+            self._print_email_auth_help()
+            return False
+        except Exception as e:
+            print(f"\nError sending email: {e}")
+            return False
+    
+    async def deliver_async(self):
+        """Async counterpart of deliver: render off the loop, send everything concurrently"""
+        model, outputs, filepath = await asyncio.to_thread(self._render_and_save)
+        
+        sends = [self.send_email_async(outputs['html'], filepath, text=outputs['text'])]
         if self.top_articles:
-            critical_articles = [a for a in self.top_articles if a.get('priority') == 'critical']
-            if critical_articles:
-                message = f"🚨 {len(critical_articles)} CRITICAL article(s) found!\n\n"
-                for a in critical_articles[:3]:
-                    message += f"• {a['title']}\n  {a['link']}\n\n"
-                self._send_to_teams(message, is_critical=True)
-                self._send_to_slack(message, is_critical=True)
-            else:
-                message = f"📊 Tech Watch Report - {len(self.articles)} articles collected\n"
-                if self.trends:
-                    message += f"🔥 Top trends: {', '.join([t['keyword'] for t in self.trends[:5]])}\n"
-                message += f"\nView full report: file://{filepath}"
-                self._send_to_teams(message)
-                self._send_to_slack(message)
+            is_critical = bool(model['critical_articles'])
+            sends.append(self._send_webhook_async('teams', outputs['chat'], is_critical))
+            sends.append(self._send_webhook_async('slack', outputs['chat'], is_critical))
+        await asyncio.gather(*sends)
+        
+        return filepath
+    
+    async def _run_profiles_async(self):
+        """Async counterpart of run_profiles"""
+        profiles = self._prepare_profiles()
+        for _, _, alerter in self.profile_alerters:
+            # Profile alerts go through the shared client and limits too
+            alerter.http_client, alerter.io_limit, alerter.loop = self.http_client, self.io_limit, self.loop
+        
+        await self.fetch_feeds_async()
+        if len(self.articles) == 0:
+            print("\nNo recent articles found")
+            return {}
+        
+        # The shared article set is scored with the base rules and indexed once for all profiles
+        await asyncio.to_thread(self._prioritize_articles)
+        await asyncio.to_thread(self.index_articles)
+        
+        views = [self._profile_view(name, keywords, config) for name, keywords, config in profiles]
+        for view in views:
+            # Profiles share the connection pool and the concurrency limits
+            view.http_client, view.io_limit, view.host_limits = self.http_client, self.io_limit, self.host_limits
+        
+        async def deliver(view):
+            if not view.articles:
+                return None
+            filepath = await view.deliver_async()
+            await asyncio.to_thread(view.cleanup_old_reports)
+            return filepath
+        
+        results = await asyncio.gather(*(deliver(view) for view in views), return_exceptions=True)
+        for (name, _, _), result in zip(profiles, results):
+            if isinstance(result, Exception):
+                print(f"Profile {name} failed: {result}")
+        return {
+            name: (None if isinstance(result, Exception) else result)
+            for (name, _, _), result in zip(profiles, results)
+        }
+    
+    async def run_async(self):
+        """Run the fetch, enrichment and delivery steps with asyncio"""
+        self.io_limit = asyncio.Semaphore(self._async_config()['max_concurrency'])
+        self.http_client = self._open_http_client()
+        self.loop = asyncio.get_running_loop()
+        try:
+            if self.config.get('profiles'):
+                return await self._run_profiles_async()
+            
+            await self.fetch_feeds_async()
+            if len(self.articles) == 0:
+                print("\nNo recent articles found")
+                return None
+            
+            result = await self.deliver_async()
+            # Indexed once the report has scored the articles
+            await asyncio.to_thread(self.index_articles)
+            await asyncio.to_thread(self.cleanup_old_reports)
+            return result
+        finally:
+            self.loop = None
+            await self._close_http_client()
+    
+    def run(self):
+        """Run the complete tech watch"""
+        print("=" * 60)
+        print("Starting mastermaint tech watch")
+        print("=" * 60)
         
-        # Cleanup
-        self.cleanup_old_reports()
+        if self._async_config()['enabled']:
+            result = asyncio.run(self.run_async())
+        elif self.config.get('profiles'):
+            result = self.run_profiles()
+        else:
+            # Fetch feeds
+            self.fetch_feeds()
+            
+            if len(self.articles) == 0:
+                print("\nNo recent articles found")
+                return None
+            
+            result = self.deliver()
+            
+            # Persist articles to the searchable archive, with the priorities of the report
+            self.index_articles()
+            
+            # Cleanup
+            self.cleanup_old_reports()
         
         print("\n" + "=" * 60)
         print("Tech watch completed successfully!")
         print("=" * 60)
         
-        return filepath
+        return result
+
+
+def _print_search_results(results, elapsed_ms):
+    """Print search results in a compact, readable format"""
+    if not results:
+        print(f"No matching articles ({elapsed_ms:.1f} ms)")
+        return
+    
+    for article in results:
+        timestamp = article['published'] or article['first_seen']
+        date = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+        first_seen = datetime.fromtimestamp(article['first_seen']).strftime("%Y-%m-%d")
+        print(f"{date}  [{article['priority'] or '-'}] {article['title']}")
+        print(f"            {article['category']} / {article['feed_name']} (first seen {first_seen})")
+        print(f"            {article['link']}")
+    
+    print(f"\n{len(results)} result(s) in {elapsed_ms:.1f} ms")
+
+
+def _sample_stacks(stacks, stop, interval):
+    """Count the call stacks of the other threads every interval, as collapsed stacks"""
+    own = threading.get_ident()
+    while not stop.wait(interval):
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stack.append(thread_names.get(ident, str(ident)))
+            key = ';'.join(reversed(stack))
+            stacks[key] = stacks.get(key, 0) + 1
+
+
+def _profile_run(watch, interval=0.005):
+    """Run the tech watch under cProfile, a stack sampler and tracemalloc
+    
+    Writes profile_<timestamp>.pstats, .collapsed (flamegraph.pl / speedscope),
+    .memory.txt (top allocation sites) and .json (run size and duration) to the reports folder.
+    """
+    # Only imported here: runs without --profile never load the profilers
+    import cProfile
+    import pstats
+    import tracemalloc
+    
+    output_folder = Path(watch.config['output']['folder'])
+    output_folder.mkdir(parents=True, exist_ok=True)
+    started = datetime.now()
+    base = output_folder / f"profile_{started.strftime('%Y%m%d_%H%M%S')}"
+    
+    stacks = {}
+    stop = threading.Event()
+    sampler = threading.Thread(target=_sample_stacks, args=(stacks, stop, interval), name='profile-sampler', daemon=True)
+    profiler = cProfile.Profile()
+    
+    tracemalloc.start()
+    sampler.start()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        return watch.run()
+    finally:
+        profiler.disable()
+        duration = time.perf_counter() - start
+        stop.set()
+        sampler.join()
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        profiler.dump_stats(f"{base}.pstats")
+        
+        with open(f"{base}.collapsed", 'w', encoding='utf-8') as f:
+            for stack, count in sorted(stacks.items()):
+                f.write(f"{stack} {count}\n")
+        
+        with open(f"{base}.memory.txt", 'w', encoding='utf-8') as f:
+            f.write(f"Peak traced memory: {peak / 1024 / 1024:.1f} MB\n")
+            f.write("Memory still allocated at the end of the run, by allocation site:\n\n")
+            for stat in snapshot.statistics('lineno')[:25]:
+                frame = stat.traceback[0]
+                f.write(f"{stat.size / 1024:>10.1f} KB {stat.count:>7} block(s)  {frame.filename}:{frame.lineno}\n")
+        
+        # Run size, so profiles of different days can be compared
+        feeds = {feed['url'] for feeds in watch.config.get('rss_feeds', {}).values() for feed in feeds}
+        with open(f"{base}.json", 'w', encoding='utf-8') as f:
+            json.dump({
+                'started': started.isoformat(),
+                'duration_s': round(duration, 3),
+                'feed_count': len(feeds),
+                'article_count': len(watch.articles),
+                'error_count': len(watch.errors),
+                'peak_memory_mb': round(peak / 1024 / 1024, 1),
+                'stack_samples': sum(stacks.values()),
+                'sample_interval_ms': interval * 1000,
+                'python': sys.version.split()[0]
+            }, f, indent=2)
+        
+        print(f"\nProfile: {len(feeds)} feed(s), {len(watch.articles)} article(s) in {duration:.1f}s, "
+              f"peak memory {peak / 1024 / 1024:.1f} MB")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+        print(f"Profile files: {base}.*")
 
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Local tech watch")
+    parser.add_argument('--config', default="config.yaml", help="Path to the configuration file")
+    parser.add_argument('--profile', action='store_true',
+                        help="Profile the run (CPU, call stacks, memory) and save the results to the reports folder")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    subparsers.add_parser('run', help="Fetch feeds and generate the report (default)")
+    
+    search_parser = subparsers.add_parser('search', help="Search the article archive")
+    search_parser.add_argument('query', help="Search terms (all terms must match)")
+    search_parser.add_argument('--category', help="Only articles from this category")
+    search_parser.add_argument('--feed', help="Only articles from this feed name")
+    search_parser.add_argument('--priority', choices=['critical', 'high', 'medium', 'low'])
+    search_parser.add_argument('--since', help="Only articles published on or after this date")
+    search_parser.add_argument('--until', help="Only articles published on or before this date")
+    search_parser.add_argument('--limit', type=int, default=20)
+    search_parser.add_argument('--raw', action='store_true', help="Pass the query as raw FTS5 syntax")
+    
+    show_parser = subparsers.add_parser('show', help="Print a past report, archived or not")
+    show_parser.add_argument('date', help="Date of the report (e.g. 2025-10-23)")
+    show_parser.add_argument('--format', choices=sorted(REPORT_RENDERERS), default='html')
+    show_parser.add_argument('--output', help="Write the report to this file instead of printing it")
+    
+    args = parser.parse_args()
+    
     try:
-        watch = TechWatch()
-        watch.run()
+        watch = TechWatch(args.config)
+        
+        if args.command == 'search':
+            start = time.perf_counter()
+            results = watch.search_articles(
+                args.query,
+                category=args.category,
+                feed=args.feed,
+                priority=args.priority,
+                since=args.since,
+                until=args.until,
+                limit=args.limit,
+                raw=args.raw
+            )
+            _print_search_results(results, (time.perf_counter() - start) * 1000)
+        elif args.command == 'show':
+            content = watch.load_report(args.date, extension=REPORT_RENDERERS[args.format]['extension'])
+            if content is None:
+                print(f"No {args.format} report for {args.date}")
+                sys.exit(1)
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                print(f"Report written to {args.output}")
+            else:
+                print(content)
+        elif args.profile:
+            _profile_run(watch)
+        else:
+            watch.run()
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
         sys.exit(0)
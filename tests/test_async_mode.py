@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Async I/O mode against local stand-in servers
+Feeds answer 200, 304 or 503 and a webhook sink records notifications; every
+scenario runs on the httpx client and on the pooled requests session
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import sqlite3
+import tempfile
+import threading
+import unittest
+import email.utils
+from unittest import mock
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from tech_watch import TechWatch
+
+
+def build_feed(prefix, count=3):
+    """RSS feed of recent entries"""
+    published = email.utils.formatdate(time.time() - 3600)
+    items = ''.join(
+        f"<item><title>{prefix} update {i}</title>"
+        f"<link>https://example.com/{prefix}/{i}</link>"
+        f"<description>{prefix} service update {i} brings a new feature.</description>"
+        f"<pubDate>{published}</pubDate></item>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>{prefix}</title>{items}</channel></rss>'.encode()
+
+
+class StandInServer:
+    """HTTP server serving feeds and recording requests and webhook posts"""
+
+    def __init__(self):
+        self.feeds = {}
+        self.status = {}
+        self.requests = []
+        self.posts = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, self.headers.get('If-None-Match')))
+                status = server.status.get(self.path, 200)
+                if status != 200:
+                    self.send_response(status)
+                    self.end_headers()
+                    return
+                if self.headers.get('If-None-Match') == '"v1"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = server.feeds[self.path]
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/rss+xml')
+                self.send_header('ETag', '"v1"')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                server.posts.append((self.path, json.loads(self.rfile.read(int(self.headers['Content-Length'])))))
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def get_count(self, path):
+        return sum(1 for requested, _ in self.requests if requested == path)
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class AsyncModeTests(unittest.TestCase):
+    # Hiding httpx makes _open_http_client fall back to the requests session
+    BACKENDS = {'httpx': {}, 'requests': {'httpx': None}}
+
+    def setUp(self):
+        self.feeds_host = StandInServer()
+        self.flaky_host = StandInServer()
+        self.addCleanup(self.feeds_host.close)
+        self.addCleanup(self.flaky_host.close)
+        self.feeds_host.feeds['/azure.xml'] = build_feed('azure')
+        self.feeds_host.feeds['/terraform.xml'] = build_feed('terraform')
+        for path in ('/a.xml', '/b.xml', '/c.xml'):
+            self.flaky_host.feeds[path] = build_feed(path.strip('/.xml'))
+
+    def make_config(self, folder, **extra):
+        config = {
+            'output': {
+                'folder': os.path.join(folder, 'reports'),
+                'data_folder': os.path.join(folder, 'data'),
+                'days_back': 2,
+                'retention_days': 30
+            },
+            'rss_feeds': {
+                'azure': [{'name': 'Azure', 'url': f"{self.feeds_host.url}/azure.xml"}],
+                'terraform': [{'name': 'Terraform', 'url': f"{self.feeds_host.url}/terraform.xml"}]
+            },
+            'features': {
+                'async_io': {'enabled': True, 'max_concurrency': 4},
+                'fetcher': {'circuit_breaker': {'failure_threshold': 2}},
+                'slack': {'enabled': True, 'webhook_url': f"{self.feeds_host.url}/webhook"}
+            }
+        }
+        config.update(extra)
+        return config
+
+    def run_watch(self, backend, config):
+        with mock.patch.dict(sys.modules, self.BACKENDS[backend]):
+            watch = TechWatch(config=json.loads(json.dumps(config)))
+            result = asyncio.run(watch.run_async())
+        return watch, result
+
+    def test_fetch_revalidate_and_notify(self):
+        for backend in self.BACKENDS:
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as folder:
+                self.feeds_host.requests.clear()
+                self.feeds_host.posts.clear()
+                config = self.make_config(folder)
+
+                watch, report = self.run_watch(backend, config)
+                self.assertEqual(len(watch.articles), 6)
+                self.assertTrue(os.path.exists(report))
+                self.assertEqual([path for path, _ in self.feeds_host.posts], ['/webhook'])
+
+                # Second run: conditional GET, 304, articles served from the cached copy
+                watch, _ = self.run_watch(backend, config)
+                self.assertEqual(len(watch.articles), 6)
+                self.assertEqual(self.feeds_host.requests[-2:][0][1], '"v1"')
+                self.assertFalse(any(article['stale'] for article in watch.articles))
+
+    def test_circuit_breaker_and_stale_cache(self):
+        for backend in self.BACKENDS:
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as folder:
+                self.flaky_host.requests.clear()
+                self.flaky_host.status.clear()
+                config = self.make_config(folder)
+                config['rss_feeds']['flaky'] = [
+                    {'name': name, 'url': f"{self.flaky_host.url}/{name}.xml"} for name in ('a', 'b', 'c')
+                ]
+                # One feed at a time on the flaky host, so the breaker opens before the last one
+                config['features']['async_io']['per_host_concurrency'] = 1
+
+                watch, _ = self.run_watch(backend, config)
+                self.assertEqual(len(watch.articles), 15)
+
+                self.flaky_host.status.update({'/a.xml': 503, '/b.xml': 503, '/c.xml': 503})
+                watch, _ = self.run_watch(backend, config)
+
+                # Two host failures open the breaker: the third feed is never requested
+                second_run = self.flaky_host.requests[3:]
+                self.assertEqual(len(second_run), 2)
+                # All three feeds fall back to their last good copy
+                stale = [article for article in watch.articles if article['stale']]
+                self.assertEqual(len(stale), 9)
+                self.assertTrue(any('circuit open' in error for error in watch.errors))
+
+    def test_alert_and_report_agree_on_priority(self):
+        # The only critical keyword sits at the end of a body much longer than the smart summary
+        body = ' '.join(f"Sentence {i} describes a routine platform change." for i in range(40)) + " It fixes a CVE."
+        published = email.utils.formatdate(time.time() - 3600)
+        self.feeds_host.feeds['/long.xml'] = (
+            '<?xml version="1.0"?><rss version="2.0"><channel><title>long</title>'
+            f'<item><title>Platform notes</title><link>https://example.com/long</link>'
+            f'<description>{body}</description><pubDate>{published}</pubDate></item></channel></rss>'
+        ).encode()
+        for backend in self.BACKENDS:
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as folder:
+                self.feeds_host.posts.clear()
+                config = self.make_config(folder, rss_feeds={
+                    'azure': [{'name': 'Long', 'url': f"{self.feeds_host.url}/long.xml"}]
+                })
+                config['features']['priority_tagging'] = {'enabled': True, 'rules': {'critical': ['cve']}}
+
+                # The fast path alerts through the pooled client, never a blocking requests.post
+                with mock.patch('tech_watch.requests.post', side_effect=AssertionError('requests.post')):
+                    watch, _ = self.run_watch(backend, config)
+                self.assertNotIn('cve', watch.articles[0]['summary'].lower())
+                self.assertEqual(watch.articles[0]['priority'], 'critical')
+                self.assertEqual(len(watch.report_model['critical_articles']), 1)
+                alerts = [post for _, post in self.feeds_host.posts if 'CRITICAL article' in post['text']]
+                self.assertEqual(len(alerts), 1)
+
+    def test_index_stores_report_priorities(self):
+        for backend in self.BACKENDS:
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as folder:
+                config = self.make_config(folder)
+                config['features']['priority_tagging'] = {
+                    'enabled': True, 'rules': {'high': ['azure'], 'medium': ['update']}
+                }
+                config['features']['duplicate_detection'] = {'enabled': True, 'similarity_threshold': 0.5}
+
+                # Second run: unchanged entries, as when priorities used to be reused from the first one
+                self.run_watch(backend, config)
+                watch, _ = self.run_watch(backend, config)
+                report = {a['link']: (a['priority'], a['priority_score']) for a in watch.report_model['sorted_articles']}
+                with sqlite3.connect(os.path.join(folder, 'data', 'archive.db')) as conn:
+                    indexed = {link: (priority, score) for link, priority, score in
+                               conn.execute("SELECT link, priority, priority_score FROM articles")}
+                self.assertEqual(indexed, report)
+
+    def test_profiles_share_one_fetch(self):
+        for backend in self.BACKENDS:
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as folder:
+                self.feeds_host.requests.clear()
+                self.feeds_host.posts.clear()
+                config = self.make_config(folder, profiles=[
+                    {'name': 'cloud', 'keywords': ['azure']},
+                    {'name': 'iac', 'keywords': ['terraform'],
+                     'features': {'priority_tagging': {'enabled': True, 'rules': {'critical': ['terraform']}}}}
+                ])
+
+                with mock.patch('tech_watch.requests.post', side_effect=AssertionError('requests.post')):
+                    watch, results = self.run_watch(backend, config)
+                alerts = [post for _, post in self.feeds_host.posts if 'CRITICAL article' in post['text']]
+                self.assertEqual(len(alerts), 1)
+                self.assertIn('3 CRITICAL', alerts[0]['text'])
+                self.assertEqual(self.feeds_host.get_count('/azure.xml'), 1)
+                self.assertEqual(self.feeds_host.get_count('/terraform.xml'), 1)
+                self.assertEqual(set(results), {'cloud', 'iac'})
+                self.assertEqual(len({str(path) for path in results.values()}), 2)
+                self.assertTrue(all(os.path.exists(path) for path in results.values()))
+
+    def test_profiles_export_separate_archives(self):
+        for backend in self.BACKENDS:
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as folder:
+                config = self.make_config(folder, profiles=[
+                    {'name': 'cloud', 'keywords': ['azure']},
+                    {'name': 'iac', 'keywords': ['terraform']}
+                ])
+                # As in config.yaml: the base configuration names its archive folder explicitly
+                config['features']['archive_export'] = {'enabled': True, 'folder': os.path.join(folder, 'archive')}
+
+                watch, _ = self.run_watch(backend, config)
+                for name, _, profile_config in watch._profile_configs():
+                    records = TechWatch(config=profile_config).read_archive()
+                    self.assertEqual(len(records), 3)
+                    self.assertTrue(all(name == 'cloud' or 'terraform' in record['link'] for record in records))
+                    self.assertTrue(all(name == 'iac' or 'azure' in record['link'] for record in records))
+                self.assertFalse(os.path.exists(os.path.join(folder, 'archive')))
+
+
+if __name__ == "__main__":
+    unittest.main()
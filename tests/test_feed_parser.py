@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Streaming RSS/Atom parser against feedparser
+Feeds that do not list their newest entries first must yield the same articles
+"""
+
+import os
+import sys
+import time
+import tempfile
+import unittest
+import email.utils
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from tech_watch import TechWatch
+
+
+def rss_item(name, age_days):
+    published = email.utils.formatdate(time.time() - age_days * 86400)
+    return (f"<item><title>{name}</title><link>https://example.com/{name}</link>"
+            f"<description>{name} update</description><pubDate>{published}</pubDate></item>")
+
+
+def atom_entry(name, published_days, updated_days):
+    def iso(days):
+        return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return (f"<entry><title>{name}</title><link href=\"https://example.com/{name}\"/><id>{name}</id>"
+            f"<summary>{name} update</summary><published>{iso(published_days)}</published>"
+            f"<updated>{iso(updated_days)}</updated></entry>")
+
+
+# An old pinned item on top of three recent ones
+PINNED_RSS = ('<?xml version="1.0"?><rss version="2.0"><channel><title>pinned</title>'
+              + rss_item('pinned', 30) + ''.join(rss_item(f"recent-{i}", 0.5) for i in range(3))
+              + '</channel></rss>').encode()
+
+# Ordered by <updated>: an old entry edited in place moved to the top
+EDITED_ATOM = ('<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>edited</title>'
+               + atom_entry('edited', 30, 0.2) + atom_entry('old', 30, 30)
+               + ''.join(atom_entry(f"recent-{i}", 0.5, 0.5) for i in range(2))
+               + '</feed>').encode()
+
+
+class StreamingParserTests(unittest.TestCase):
+
+    def make_watch(self, folder, streaming):
+        return TechWatch(config={
+            'output': {'folder': os.path.join(folder, 'reports'), 'data_folder': os.path.join(folder, 'data'),
+                       'days_back': 2},
+            'rss_feeds': {
+                'pinned': [{'name': 'Pinned', 'url': 'https://example.com/pinned.xml'}],
+                'edited': [{'name': 'Edited', 'url': 'https://example.com/edited.xml'}]
+            },
+            'features': {'fetcher': {'streaming_parser': streaming}, 'search_index': {'enabled': False}}
+        })
+
+    def test_old_entries_do_not_stop_parsing(self):
+        with tempfile.TemporaryDirectory() as folder:
+            watch = self.make_watch(folder, True)
+            cutoff = datetime.now() - timedelta(days=2)
+            links = [entry['link'] for entry in watch._stream_entries(PINNED_RSS, 20, cutoff)]
+            self.assertEqual(links, [f"https://example.com/recent-{i}" for i in range(3)])
+            # The cutoff applies to the latest of published and updated
+            links = [entry['link'] for entry in watch._stream_entries(EDITED_ATOM, 20, cutoff)]
+            self.assertEqual(links, ['https://example.com/edited', 'https://example.com/recent-0',
+                                     'https://example.com/recent-1'])
+
+    def test_run_of_old_entries_stops_parsing(self):
+        with tempfile.TemporaryDirectory() as folder:
+            watch = self.make_watch(folder, True)
+            feed = ('<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>'
+                    + ''.join(rss_item(f"old-{i}", 30) for i in range(2)) + rss_item('recent', 0.5)
+                    + '</channel></rss>').encode()
+            cutoff = datetime.now() - timedelta(days=2)
+            self.assertEqual(len(watch._stream_entries(feed, 20, cutoff, max_old=3)), 1)
+            self.assertEqual(watch._stream_entries(feed, 20, cutoff, max_old=2), [])
+
+    def test_both_parsers_collect_the_same_articles(self):
+        documents = {
+            'https://example.com/pinned.xml': (PINNED_RSS, False),
+            'https://example.com/edited.xml': (EDITED_ATOM, False)
+        }
+        collected = {}
+        for streaming in (False, True):
+            with tempfile.TemporaryDirectory() as folder:
+                watch = self.make_watch(folder, streaming)
+                watch.fetch_feeds(documents, False)
+                collected[streaming] = sorted(article['link'] for article in watch.articles)
+        self.assertEqual(len(collected[False]), 5)
+        self.assertEqual(collected[True], collected[False])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Full-text search archive
+Terms outside the summary extract stay searchable, including in archives created before
+the entry text was indexed
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from tech_watch import TechWatch
+
+
+# Schema of archives created before the entry text was indexed
+LEGACY_SCHEMA = """
+    CREATE TABLE articles (
+        id INTEGER PRIMARY KEY, link TEXT UNIQUE NOT NULL, title TEXT, summary TEXT, category TEXT,
+        feed_name TEXT, priority TEXT, priority_score REAL, published INTEGER, first_seen INTEGER NOT NULL
+    );
+    CREATE VIRTUAL TABLE articles_fts USING fts5(
+        title, summary, content='articles', content_rowid='id', tokenize='porter unicode61'
+    );
+    CREATE TRIGGER articles_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+    END;
+    INSERT INTO articles (link, title, summary, category, feed_name, first_seen)
+    VALUES ('https://example.com/legacy', 'Legacy entry', 'Kubelet changes', 'azure', 'Azure', 0);
+"""
+
+
+class SearchIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.watch = TechWatch(config={
+            'output': {'folder': os.path.join(self.folder.name, 'reports'),
+                       'data_folder': os.path.join(self.folder.name, 'data'), 'days_back': 2},
+            'rss_feeds': {}
+        })
+        self.watch.articles = [{
+            'category': 'azure',
+            'feed_name': 'Azure Updates',
+            'title': 'AKS release notes',
+            'link': 'https://example.com/aks',
+            'summary': 'New node pool features are available.',
+            'raw_summary': '<p>New node pool features are available.</p>'
+                           '<p>The <b>dockershim</b> deprecation notice takes effect next quarter.</p>',
+            'published': None,
+            'priority': 'medium',
+            'priority_score': 50.0
+        }]
+
+    def search(self, query):
+        return [result['link'] for result in self.watch.search_articles(query)]
+
+    def test_entry_text_is_searchable(self):
+        self.assertEqual(self.watch.index_articles(), 1)
+        self.assertEqual(self.search('dockershim deprecation'), ['https://example.com/aks'])
+        self.assertEqual(self.search('node pool'), ['https://example.com/aks'])
+        self.assertEqual(self.search('<b>'), [])
+
+    def test_score_changes_keep_entry_searchable(self):
+        self.watch.index_articles()
+        self.watch.articles[0]['priority_score'] = 42.0
+        self.assertEqual(self.watch.index_articles(), 1)
+        self.assertEqual(self.search('dockershim'), ['https://example.com/aks'])
+
+    def test_legacy_archive_is_migrated(self):
+        os.makedirs(os.path.join(self.folder.name, 'data'))
+        with sqlite3.connect(os.path.join(self.folder.name, 'data', 'archive.db')) as conn:
+            conn.executescript(LEGACY_SCHEMA)
+        conn.close()
+
+        self.watch.index_articles()
+        self.assertEqual(self.search('dockershim'), ['https://example.com/aks'])
+        self.assertEqual(self.search('kubelet'), ['https://example.com/legacy'])
+
+
+if __name__ == "__main__":
+    unittest.main()
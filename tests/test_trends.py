@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Trend analysis over the persisted daily history
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from tech_watch import TechWatch
+
+
+class TrendTests(unittest.TestCase):
+
+    def test_terms_absent_last_week_are_new(self):
+        with tempfile.TemporaryDirectory() as folder:
+            watch = TechWatch(config={
+                'output': {'folder': os.path.join(folder, 'reports'),
+                           'data_folder': os.path.join(folder, 'data'), 'days_back': 2},
+                'rss_feeds': {},
+                'technology_keywords': {'cloud': ['azure', 'terraform']},
+                'features': {'trends_analysis': {'enabled': True, 'min_mentions': 1}}
+            })
+            # Last week: azure twice, terraform never
+            today = datetime.now().date().toordinal()
+            np.savez_compressed(
+                watch._data_path('trends_history.npz'),
+                days=np.array([today - 8]), terms=np.array(['azure', 'terraform']), counts=np.array([[2, 0]]),
+                seen=np.zeros(0, dtype=np.uint64), seen_days=np.zeros(0, dtype=np.int64)
+            )
+            watch.articles = [{'title': 'Azure and Terraform', 'summary': 'Azure update', 'link': 'https://example.com/1',
+                               'guid': 'https://example.com/1', 'published': None,
+                               'category': 'azure', 'feed_name': 'Azure'}]
+
+            trends = {trend['keyword']: trend for trend in watch._analyze_trends()}
+            self.assertEqual((trends['azure']['growth'], trends['azure']['new']), (0, False))
+            self.assertEqual((trends['terraform']['growth'], trends['terraform']['new']), (None, True))
+            self.assertIn('>new</span>', watch.render_report(watch.build_report_model(), 'html'))
+
+
+if __name__ == "__main__":
+    unittest.main()